@@ -1,10 +1,12 @@
 """Utility to build the addon's zip file."""
 
+import ast
 import os
 import re
+import time
 import zipfile
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Iterator
 
 ####################################################################################################
 # Exclude folders and files
@@ -24,6 +26,16 @@ EXCLUDE_FILES = (
     r"requirements.txt"
 )
 
+# deflate level used for the zip members, override with the `SFMFLOW_ZIP_LEVEL` environment variable
+ZIP_COMPRESSION_LEVEL = int(os.environ.get("SFMFLOW_ZIP_LEVEL", "4"))
+
+# files already compressed by their own format, stored as-is to avoid deflating them again
+STORED_EXTENSIONS = (".jpg", ".jpeg", ".png", ".zip")
+
+# patterns joined in a single alternation and compiled once, matched against every scanned entry
+_EXCLUDE_DIRS_RE = re.compile("|".join("(?:{})".format(p) for p in EXCLUDE_DIRS))
+_EXCLUDE_FILES_RE = re.compile("|".join("(?:{})".format(p) for p in EXCLUDE_FILES))
+
 
 ####################################################################################################
 # Load addon informations
@@ -38,16 +50,37 @@ def load_addon_infos() -> Dict:
         Dict -- bl_info, @see https://wiki.blender.org/wiki/Process/Addons/Guidelines/metainfo
     """
     addon_init = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../__init__.py")
-    addon_infos = {}   # pylint: disable=redefined-outer-name
     with open(addon_init, 'r') as f:
-        s = f.read()
-        d = re.search(r'bl_info = \{[^\}]*\}', s)
-        if d is None:
-            raise EnvironmentError("Cannot load the addon information dictionary!")
-        g = d.group(0)
-        exec(g, addon_infos)   # pylint: disable=exec-used
-        addon_infos = addon_infos["bl_info"]
-    return addon_infos
+        tree = ast.parse(f.read(), filename=addon_init)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "bl_info" for t in node.targets):
+            return ast.literal_eval(node.value)
+    raise EnvironmentError("Cannot load the addon information dictionary!")
+
+
+####################################################################################################
+# Collect addon files
+
+def scan_addon_files(directory: str) -> Iterator[os.DirEntry]:
+    """List the files in a directory tree, skipping the excluded folders and files.
+    The tree is visited using an explicit stack of folders, only not-excluded folders are pushed.
+
+    Arguments:
+        directory {str} -- directory to be scanned
+
+    Yields:
+        os.DirEntry -- entry of each file to be added to the zip
+    """
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if _EXCLUDE_DIRS_RE.match(entry.name) is None:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    if _EXCLUDE_FILES_RE.match(entry.name) is None:
+                        yield entry
 
 
 ####################################################################################################
@@ -73,22 +106,28 @@ if __name__ == '__main__':
     print("Version: " + addon_ver)
     print("Build date: " + build_date)
     print("Zip output: " + zip_filepath)
+    print("Compression level: {}".format(ZIP_COMPRESSION_LEVEL))
     #
-    with zipfile.ZipFile(zip_filepath, mode='w', compression=zipfile.ZIP_DEFLATED, allowZip64=False) as zf:
+    with zipfile.ZipFile(zip_filepath, mode='w', compression=zipfile.ZIP_DEFLATED,
+                         compresslevel=ZIP_COMPRESSION_LEVEL, allowZip64=False) as zf:
         print("\nBuilding addon zip...")
         #
         filecount = 0
-        for root, dirs, files in os.walk(addon_dir):
-            # filter excluded dirs and files
-            dirs[:] = [d for d in dirs if not any([re.match(p, d) for p in EXCLUDE_DIRS])]
-            files[:] = [f for f in files if not any([re.match(p, f) for p in EXCLUDE_FILES])]
-            # add files to zip
-            for file in files:
-                filepath = os.path.join(root, file)
-                path = os.path.relpath(filepath, addon_dir)
-                arcname = os.path.join("sfm_flow/", path)
-                zf.write(filepath, arcname=arcname)
-                print("\t" + arcname)
-                filecount += 1
+        for entry in scan_addon_files(addon_dir):
+            path = os.path.relpath(entry.path, addon_dir)
+            arcname = os.path.join("sfm_flow/", path)
+            st = entry.stat(follow_symlinks=False)   # cached by the scandir entry where possible
+            zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime(st.st_mtime)[:6])
+            zinfo.external_attr = (st.st_mode & 0xFFFF) << 16   # keep file permissions as ZipFile.write does
+            zinfo.file_size = st.st_size
+            if entry.name.lower().endswith(STORED_EXTENSIONS):
+                zinfo.compress_type = zipfile.ZIP_STORED
+            else:
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+            with open(entry.path, 'rb') as f:
+                data = f.read()
+            zf.writestr(zinfo, data, compresslevel=ZIP_COMPRESSION_LEVEL)
+            print("\t" + arcname)
+            filecount += 1
     #
     print("\n{} files were added to zip '{}'".format(filecount, zip_filepath))
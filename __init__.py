@@ -30,19 +30,8 @@ NOTES:
 """
 
 import logging
-import sys
 
 import bpy
-from bpy.app.handlers import persistent
-
-import sfm_flow.utils.logutils as logutils
-from sfm_flow.utils.callbacks import Callbacks
-
-from .operators import *
-from .panels import *
-from .prefs import SFMFLOW_AddonProperties
-from .prefs.preferences import preferences_register, preferences_unregister
-from .reconstruction import ReconstructionsManager, SFMFLOW_ReconstructionModelProperties
 
 ####################################################################################################
 # Addon globals
@@ -59,32 +48,68 @@ bl_info = {   # pylint: disable=invalid-name
     "category": "3D Reconstruction"
 }
 
-CLASSES = (
-    # Properties
-    SFMFLOW_AddonProperties,
-    SFMFLOW_ReconstructionModelProperties,
-    #
-    # Operators
-    SFMFLOW_OT_init_scene,
-    SFMFLOW_OT_animate_camera,
-    SFMFLOW_OT_animate_camera_clear,
-    SFMFLOW_OT_render_images,
-    SFMFLOW_OT_export_ground_truth,
-    SFMFLOW_OT_evaluate_reconstruction,
-    SFMFLOW_OT_reconstruction_filter,
-    SFMFLOW_OT_reconstruction_filter_clear,
-    SFMFLOW_OT_animate_sun,
-    SFMFLOW_OT_animate_sun_clear,
-    SFMFLOW_OT_run_pipelines,
-    SFMFLOW_OT_import_reconstruction,
-    SFMFLOW_OT_sample_geometry_gt,
-    SFMFLOW_OT_align_reconstruction,
+# operators, panels and properties are imported only when the add-on is enabled, see `_import_classes()`
+CLASSES = ()   # type: tuple
+HANDLERS = ()   # type: tuple
+unregister_classes = None
+
+
+# ==================================================================================================
+def _import_classes() -> tuple:
+    """Import the add-on's classes and app handlers.
+    Deferred to `register()` so that importing a disabled add-on does not load all its sub-modules.
+
+    Returns:
+        tuple -- (classes to register, (handlers list name, callback) pairs)
+    """
+    from sfm_flow.utils.callbacks import Callbacks
+    from .operators import (SFMFLOW_OT_align_reconstruction, SFMFLOW_OT_animate_camera,
+                            SFMFLOW_OT_animate_camera_clear, SFMFLOW_OT_animate_sun, SFMFLOW_OT_animate_sun_clear,
+                            SFMFLOW_OT_evaluate_reconstruction, SFMFLOW_OT_export_ground_truth,
+                            SFMFLOW_OT_import_reconstruction, SFMFLOW_OT_init_scene, SFMFLOW_OT_reconstruction_filter,
+                            SFMFLOW_OT_reconstruction_filter_clear, SFMFLOW_OT_render_images,
+                            SFMFLOW_OT_run_pipelines, SFMFLOW_OT_sample_geometry_gt)
+    from .panels import SFMFLOW_PT_main, SFMFLOW_PT_pipelines_tools, SFMFLOW_PT_render_tools
+    from .prefs import SFMFLOW_AddonProperties
+    from .reconstruction import SFMFLOW_ReconstructionModelProperties
     #
-    # UI panels
-    SFMFLOW_PT_main,
-    SFMFLOW_PT_render_tools,
-    SFMFLOW_PT_pipelines_tools,
-)
+    classes = (
+        # Properties
+        SFMFLOW_AddonProperties,
+        SFMFLOW_ReconstructionModelProperties,
+        #
+        # Operators
+        SFMFLOW_OT_init_scene,
+        SFMFLOW_OT_animate_camera,
+        SFMFLOW_OT_animate_camera_clear,
+        SFMFLOW_OT_render_images,
+        SFMFLOW_OT_export_ground_truth,
+        SFMFLOW_OT_evaluate_reconstruction,
+        SFMFLOW_OT_reconstruction_filter,
+        SFMFLOW_OT_reconstruction_filter_clear,
+        SFMFLOW_OT_animate_sun,
+        SFMFLOW_OT_animate_sun_clear,
+        SFMFLOW_OT_run_pipelines,
+        SFMFLOW_OT_import_reconstruction,
+        SFMFLOW_OT_sample_geometry_gt,
+        SFMFLOW_OT_align_reconstruction,
+        #
+        # UI panels
+        SFMFLOW_PT_main,
+        SFMFLOW_PT_render_tools,
+        SFMFLOW_PT_pipelines_tools,
+    )
+    handlers = (
+        ("render_write", SFMFLOW_OT_render_images.render_complete_callback),
+        ("depsgraph_update_post", Callbacks.cam_pose_update),
+        ("depsgraph_update_post", Callbacks.scene_bbox_update),
+        ("undo_post", Callbacks.scene_bbox_clear),
+        ("redo_post", Callbacks.scene_bbox_clear),
+        ("frame_change_post", Callbacks.scene_bbox_clear),
+        ("save_post", Callbacks.post_save),
+        ("load_post", Callbacks.post_load),
+    )
+    return classes, handlers
 
 
 ####################################################################################################
@@ -94,6 +119,8 @@ CLASSES = (
 # ==================================================================================================
 def register() -> None:
     """Register SfM Flow functionalities"""
+    import sfm_flow.utils.logutils as logutils
+    from .prefs.preferences import preferences_register
     # load preferences
     preferences_register()
     prefs = bpy.context.preferences.addons[__name__].preferences   # type: AddonPreferences
@@ -103,31 +130,29 @@ def register() -> None:
     logutils.setup_logger(log_level=log_level)
     logger = logging.getLogger(__name__)
 
-    # register classes
-    for c in CLASSES:
-        bpy.utils.register_class(c)
-        logger.debug("Registered class: %s", c.__name__)
+    # register classes, un-registration is done in reverse order
+    global CLASSES, HANDLERS, unregister_classes   # pylint: disable=global-statement
+    CLASSES, HANDLERS = _import_classes()
+    register_classes, unregister_classes = bpy.utils.register_classes_factory(CLASSES)
+    register_classes()
+    logger.debug("Registered %i classes", len(CLASSES))
 
     # handlers
-    bpy.app.handlers.render_write.append(SFMFLOW_OT_render_images.render_complete_callback)
-    bpy.app.handlers.depsgraph_update_post.append(Callbacks.cam_pose_update)
-    bpy.app.handlers.save_post.append(Callbacks.post_save)
-    bpy.app.handlers.load_post.append(Callbacks.post_load)
+    for handlers_list, callback in HANDLERS:
+        getattr(bpy.app.handlers, handlers_list).append(callback)
 
 
 # ==================================================================================================
 def unregister() -> None:
     """Un-register SfM Flow functionalities."""
+    from .prefs.preferences import preferences_unregister
     logger = logging.getLogger(__name__)
 
     # handlers
-    bpy.app.handlers.render_write.remove(SFMFLOW_OT_render_images.render_complete_callback)
-    bpy.app.handlers.depsgraph_update_post.remove(Callbacks.cam_pose_update)
-    bpy.app.handlers.save_post.remove(Callbacks.post_save)
-    bpy.app.handlers.load_post.remove(Callbacks.post_load)
+    for handlers_list, callback in HANDLERS:
+        getattr(bpy.app.handlers, handlers_list).remove(callback)
 
     # un-register preferences and classes
     preferences_unregister()
-    for c in reversed(CLASSES):
-        bpy.utils.unregister_class(c)
-        logger.debug("Un-registered class: %s", c.__name__)
+    unregister_classes()
+    logger.debug("Un-registered %i classes", len(CLASSES))
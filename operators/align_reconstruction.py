@@ -60,6 +60,19 @@ class SFMFLOW_OT_align_reconstruction(ThreadedOperator):
         options={'SKIP_SAVE'}
     )
 
+    # ==============================================================================================
+    voxel_size: bpy.props.FloatProperty(
+        name="Ground truth voxel size",
+        description="Size of the voxel grid used to downsample the ground truth point cloud,"
+                    " 0 to use the whole cloud",
+        min=0.,
+        soft_max=1.,
+        default=0.,
+        precision=3,
+        unit='LENGTH',
+        options={'SKIP_SAVE'}
+    )
+
     # ==============================================================================================
     alignment_mode: bpy.props.EnumProperty(
         name="Alignment mode",
@@ -72,44 +85,17 @@ class SFMFLOW_OT_align_reconstruction(ThreadedOperator):
     )
 
     # ==============================================================================================
-    # alignment_matrix: bpy.props.FloatVectorProperty(
-    # FIXME this is the correct solution but does not render in blender 2.80. bug ??
-    #     name="Alignment matrix",
-    #     description="Manually set the reconstruction to ground truth alignment matrix",
-    #     size=16,
-    #     subtype="MATRIX",
-    #     default=(
-    #         1., 0., 0., 0.,
-    #         0., 1., 0., 0.,
-    #         0., 0., 1., 0.,
-    #         0., 0., 0., 1.
-    #     ),
-    #     precision=4,
-    #     unit='NONE',
-    #     options={'SKIP_SAVE'}
-    # )
-
-    alignment_matrix_row1: bpy.props.FloatVectorProperty(
-        size=4,
-        default=(1., 0., 0., 0.),
-        precision=4,
-        options={'SKIP_SAVE'}
-    )
-    alignment_matrix_row2: bpy.props.FloatVectorProperty(
-        size=4,
-        default=(0., 1., 0., 0.),
-        precision=4,
-        options={'SKIP_SAVE'}
-    )
-    alignment_matrix_row3: bpy.props.FloatVectorProperty(
-        size=4,
-        default=(0., 0., 1., 0.),
-        precision=4,
-        options={'SKIP_SAVE'}
-    )
-    alignment_matrix_row4: bpy.props.FloatVectorProperty(
-        size=4,
-        default=(0., 0., 0., 1.),
+    # NOTE subtype="MATRIX" does not render in blender 2.80, the matrix is drawn element by element
+    alignment_matrix: bpy.props.FloatVectorProperty(
+        name="Alignment matrix",
+        description="Manually set the reconstruction to ground truth alignment matrix (row-major)",
+        size=16,
+        default=(
+            1., 0., 0., 0.,
+            0., 1., 0., 0.,
+            0., 0., 1., 0.,
+            0., 0., 0., 1.
+        ),
         precision=4,
         options={'SKIP_SAVE'}
     )
@@ -124,18 +110,13 @@ class SFMFLOW_OT_align_reconstruction(ThreadedOperator):
         layout.prop(self, "alignment_mode", expand=True)
         box = layout.box()
         if self.alignment_mode == "cloud_align.matrix":
-            #box.prop(self, "alignment_matrix")
             r = box.row(align=True)
             r.label(text="Alignment matrix")
             col = box.column(align=True)
-            r = col.row(align=True)
-            r.prop(self, "alignment_matrix_row1", text="")
-            r = col.row(align=True)
-            r.prop(self, "alignment_matrix_row2", text="")
-            r = col.row(align=True)
-            r.prop(self, "alignment_matrix_row3", text="")
-            r = col.row(align=True)
-            r.prop(self, "alignment_matrix_row4", text="")
+            for i in range(0, 16, 4):
+                r = col.row(align=True)
+                for j in range(i, i + 4):
+                    r.prop(self, "alignment_matrix", index=j, text="")
         else:
             col = box.column(align=True)
             col.label(text="Iterative Closest Point (ICP) parameters")
@@ -145,6 +126,7 @@ class SFMFLOW_OT_align_reconstruction(ThreadedOperator):
                 col = box.column()
                 col.prop(self, "max_iterations")
                 col.prop(self, "samples_percentage")
+                col.prop(self, "voxel_size")
 
     ################################################################################################
     # Behavior
@@ -196,16 +178,21 @@ class SFMFLOW_OT_align_reconstruction(ThreadedOperator):
         #
         if self.alignment_mode == "cloud_align.matrix":   # use user's matrix to align
             self.progress_string = "Aligning model using matrix"
-            align_matrix = Matrix((self.alignment_matrix_row1, self.alignment_matrix_row2,
-                                   self.alignment_matrix_row3, self.alignment_matrix_row4))
+            m = self.alignment_matrix[:]
+            align_matrix = Matrix((m[0:4], m[4:8], m[8:12], m[12:16]))
             model.apply_registration_matrix(align_matrix)
             msg = "Applied registration matrix to model `{}`.".format(model.name)
         elif self.alignment_mode == "cloud_align.auto":   # use ICP alignment
             self.progress_string = "Aligning model using ICP"
             if not self.use_custom_params:
-                error = model.register_model(ReconstructionsManager.gt_points, ReconstructionsManager.gt_kdtree)
+                error = model.register_model(ReconstructionsManager.gt_points, ReconstructionsManager.get_gt_kdtree())
+            elif self.voxel_size > 0.:   # align to the downsampled cloud
+                error = model.register_model(ReconstructionsManager.get_gt_points_voxel(self.voxel_size),
+                                             ReconstructionsManager.get_gt_kdtree(self.voxel_size),
+                                             max_iterations=self.max_iterations, samples=self.samples_percentage,
+                                             use_filtered_cloud=self.use_filtered_cloud)
             else:
-                error = model.register_model(ReconstructionsManager.gt_points, ReconstructionsManager.gt_kdtree,
+                error = model.register_model(ReconstructionsManager.gt_points, ReconstructionsManager.get_gt_kdtree(),
                                              max_iterations=self.max_iterations, samples=self.samples_percentage,
                                              use_filtered_cloud=self.use_filtered_cloud)
             msg = "Reconstructed model `{}` registered to ground truth (mean error: {:.3f}).".format(model.name, error)
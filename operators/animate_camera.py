@@ -1,16 +1,24 @@
 
 import logging
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
 
 import bpy
 
-from ..utils import SceneBoundingBox, euclidean_distance
-from ..utils.animation import (get_last_keyframe, get_track_to_constraint_target,
+from ..utils import SceneBoundingBox
+from ..utils.animation import (get_last_keyframe, get_track_to_constraint_target, insert_keyframes,
                                sample_points_on_circle, sample_points_on_helix,
-                               sample_points_on_hemisphere, set_camera_focus_to_intersection,
+                               sample_points_on_hemisphere, set_camera_focus_to_intersections,
                                set_camera_target)
 
 logger = logging.getLogger(__name__)
 
+# camera locations, camera target, target keyframes (relative frames, heights and interpolation),
+# camera focus targets
+AnimationKeys = Tuple[np.ndarray, bpy.types.Object, Optional[np.ndarray], Optional[np.ndarray], Optional[str],
+                      np.ndarray]
+
 
 class SFMFLOW_OT_animate_camera(bpy.types.Operator):
     """Animate the render camera for SfM dataset generation"""
@@ -149,7 +157,7 @@ class SFMFLOW_OT_animate_camera(bpy.types.Operator):
         Returns:
             set -- enum set in {‘RUNNING_MODAL’, ‘CANCELLED’, ‘FINISHED’, ‘PASS_THROUGH’, ‘INTERFACE’}
         """
-        self._scene_bbox = SceneBoundingBox(context.scene)
+        self._scene_bbox = SceneBoundingBox.get_cached(context.scene)
         self.animation_height = self._scene_bbox.height
         self.animation_turns = int(self.animation_height // 0.5)  # make approx one turn each 0.5 height
         #
@@ -166,12 +174,7 @@ class SFMFLOW_OT_animate_camera(bpy.types.Operator):
         logger.info("Animating camera...")
 
         scene = context.scene
-        camera = scene.camera
-        if not camera:
-            msg = "No render camera selected!"
-            logger.error(msg)
-            self.report({'ERROR'}, msg)
-            return {'CANCELLED'}
+        camera = scene.camera   # checked by `poll()`
         #
         bbox = self._scene_bbox
         #
@@ -185,97 +188,24 @@ class SFMFLOW_OT_animate_camera(bpy.types.Operator):
             start_frame = lk + 1 if lk else scene.frame_start  # animation start frame
         current_frame = start_frame
         #
-        # ------------------------------------------------------------------------------------------
-        if self.animation_type == "animtype.helix":
-            # define camera target
-            target = bbox.center.copy()
-            target.z = camera.location.z   # to get distance at the same height (2D distance)
-            target_empty = set_camera_target(camera, bbox.center, camera.name + " Target")
-            # define helix params and sample positions on it
-            points_per_turn = int(self.images_count // self.animation_turns)
-            points = sample_points_on_helix(start_center=target, start_point=camera.location,
-                                            turns=self.animation_turns, points_per_turn=points_per_turn,
-                                            height=self.animation_height, randomize=self.randomize_camera_pose)
-            if self.images_count != len(points):
-                # FIXME is not guaranteed that the total images is exactly the requested
-                msg = "Requested {} frames but sampled only {}!".format(self.images_count, len(points))
-                logger.warning(msg)
-                self.report({'WARNING'}, msg)
-            # set keyframes
-            last_z = points[0].z
-            for p in points:
-                camera.location = p
-                camera.keyframe_insert(data_path="location", frame=current_frame)
-                target_empty.location.z = (p.z - last_z)
-                target_empty.keyframe_insert(data_path="location", frame=current_frame)
-                set_camera_focus_to_intersection(context.view_layer, camera, scene, current_frame)
-                current_frame += 1
-        #
-        # ------------------------------------------------------------------------------------------
-        elif self.animation_type == "animtype.hemisphere":
-            set_camera_target(camera, bbox.center, camera.name + " Target")
-            r = euclidean_distance(bbox.center, camera.location)   # get radius from current camera position
-            points = sample_points_on_hemisphere(center=bbox.center, radius=r, samples=self.images_count,
-                                                 randomize=self.randomize_camera_pose)
-            # set keyframes
-            for p in points:
-                camera.location = p
-                camera.keyframe_insert(data_path="location", frame=current_frame)
-                set_camera_focus_to_intersection(context.view_layer, camera, scene, current_frame)
-                current_frame += 1
-        #
-        # ------------------------------------------------------------------------------------------
-        elif self.animation_type == "animtype.circular":
-            # define camera target
-            target = bbox.center.copy()
-            target.z = camera.location.z   # to get distance at the same height (2D distance)
-            target_empty = set_camera_target(camera, bbox.center, camera.name + " Target")
-            # sample positions on circle
-            points = sample_points_on_circle(center=target, start_point=camera.location, points_count=self.images_count,
-                                             randomize=self.randomize_camera_pose)
-            # set keyframes
-            for p in points:
-                camera.location = p
-                camera.keyframe_insert(data_path="location", frame=current_frame)
-                set_camera_focus_to_intersection(context.view_layer, camera, scene, current_frame)
-                current_frame += 1
-        #
-        # ------------------------------------------------------------------------------------------
-        elif self.animation_type == "animtype.circular_up":
-            # define camera target
-            target = bbox.center.copy()
-            target.z = camera.location.z  # start from bottom
-            target_empty = set_camera_target(camera, target, camera.name + " Target")
-            # define circle params and sample points on it
-            turn_increment = self.animation_height / (self.animation_turns - 1)
-            points_per_turn = int(self.images_count // self.animation_turns)
-            points = sample_points_on_circle(center=target, start_point=camera.location, points_count=points_per_turn,
-                                             randomize=self.randomize_camera_pose)
-            if self.images_count != (len(points)*self.animation_turns):
-                # FIXME is not guaranteed that the total images is exactly the requested
-                msg = "Requested {} frames but sampled only {}!".format(
-                    self.images_count, (len(points)*self.animation_turns))
-                logger.warning(msg)
-                self.report({'WARNING'}, msg)
-            # set keyframes
-            target.z = bbox.z_min
-            last_z = target_empty.location.z
-            for t in range(self.animation_turns):
-                target_empty.location.z = target.z + t * turn_increment
-                target_empty.keyframe_insert(data_path="location", frame=current_frame)
-                for p in points:
-                    camera.location = p
-                    camera.keyframe_insert(data_path="location", frame=current_frame)
-                    set_camera_focus_to_intersection(context.view_layer, camera, scene, current_frame)
-                    current_frame += 1
-                target_empty.keyframe_insert(data_path="location", frame=current_frame-1)
-        #
-        # ------------------------------------------------------------------------------------------
-        else:
+        animator = self._ANIMATORS.get(self.animation_type)
+        if animator is None:
             msg = "Unknown camera animation type!"
             logger.error(msg)
-            self.report('ERROR', msg)
-            return {'CANCELED'}
+            self.report({'ERROR'}, msg)
+            return {'CANCELLED'}
+        camera_locations, target_empty, target_frames, target_keys, target_interpolation, focus_targets = \
+            animator(self, camera, bbox)
+        #
+        # set keyframes, all the animation types share the same batched keyframe insertion
+        frames = np.arange(current_frame, current_frame + len(camera_locations))
+        insert_keyframes(camera, "location", frames, camera_locations)
+        if target_keys is not None:
+            # only the target height changes, X and Y are never keyed
+            insert_keyframes(target_empty, "location", current_frame + target_frames, target_keys, index=2,
+                             interpolation=target_interpolation)
+        set_camera_focus_to_intersections(context.view_layer, camera, scene, frames, camera_locations, focus_targets)
+        current_frame += len(frames)
         #
         # set sequence frames
         if scene.frame_start > start_frame:
@@ -288,6 +218,99 @@ class SFMFLOW_OT_animate_camera(bpy.types.Operator):
         logger.info("Camera '%s' animated using animation type: %s.", camera.name, self.animation_type)
         return {'FINISHED'}
 
+    ################################################################################################
+    # Animation types
+    #
+    # Each animation type samples the camera locations and the camera target keys, frames are relative to the
+    # animation start and target keys are the target heights. Returns the tuple (camera_locations, target_empty,
+    # target_frames, target_keys, target_interpolation, focus_targets), `target_keys` is {None} when the target
+    # is not animated and `target_interpolation` is {None} to use the user preferences.
+    #
+
+    # ==============================================================================================
+    def _animate_helix(self, camera: bpy.types.Object, bbox: SceneBoundingBox) -> AnimationKeys:
+        """Helix around the scene, the camera target follows the camera height."""
+        # define camera target
+        target = bbox.center.copy()
+        target.z = camera.location.z   # to get distance at the same height (2D distance)
+        target_empty = set_camera_target(camera, bbox.center, camera.name + " Target")
+        # define helix params and sample positions on it
+        points_per_turn = int(self.images_count // self.animation_turns)
+        points = sample_points_on_helix(start_center=target, start_point=camera.location,
+                                        turns=self.animation_turns, points_per_turn=points_per_turn,
+                                        height=self.animation_height, randomize=self.randomize_camera_pose)
+        self._check_sampled_count(len(points))
+        target_locations = np.empty((len(points), 3), dtype=np.float32)
+        target_locations[:] = target_empty.location
+        target_locations[:, 2] = points[:, 2] - points[0][2]
+        return points, target_empty, np.arange(len(points)), target_locations[:, 2], None, target_locations
+
+    # ==============================================================================================
+    def _animate_hemisphere(self, camera: bpy.types.Object, bbox: SceneBoundingBox) -> AnimationKeys:
+        """Positions sampled on an hemisphere centered in the scene, the camera target is fixed."""
+        target_empty = set_camera_target(camera, bbox.center, camera.name + " Target")
+        r = (bbox.center - camera.location).length   # get radius from current camera position
+        points = sample_points_on_hemisphere(center=bbox.center, radius=r, samples=self.images_count,
+                                             randomize=self.randomize_camera_pose)
+        return points, target_empty, None, None, None, target_empty.location
+
+    # ==============================================================================================
+    def _animate_circular(self, camera: bpy.types.Object, bbox: SceneBoundingBox) -> AnimationKeys:
+        """Single circle around the center of the scene, the camera target is fixed."""
+        # define camera target
+        target = bbox.center.copy()
+        target.z = camera.location.z   # to get distance at the same height (2D distance)
+        target_empty = set_camera_target(camera, bbox.center, camera.name + " Target")
+        # sample positions on circle
+        points = sample_points_on_circle(center=target, start_point=camera.location, points_count=self.images_count,
+                                         randomize=self.randomize_camera_pose)
+        return points, target_empty, None, None, None, target_empty.location
+
+    # ==============================================================================================
+    def _animate_circular_up(self, camera: bpy.types.Object, bbox: SceneBoundingBox) -> AnimationKeys:
+        """Multiple circles sharing the camera positions, the camera target moves up on each turn."""
+        # define camera target
+        target = bbox.center.copy()
+        target.z = camera.location.z  # start from bottom
+        target_empty = set_camera_target(camera, target, camera.name + " Target")
+        # define circle params and sample points on it
+        turn_increment = self.animation_height / (self.animation_turns - 1)
+        points_per_turn = int(self.images_count // self.animation_turns)
+        points = sample_points_on_circle(center=target, start_point=camera.location, points_count=points_per_turn,
+                                         randomize=self.randomize_camera_pose)
+        self._check_sampled_count(len(points)*self.animation_turns)
+        # camera positions are repeated on each turn
+        camera_locations = np.tile(points, (self.animation_turns, 1))
+        # target is keyed once at the start of each turn, the height is constant during the turn
+        target_frames = np.arange(self.animation_turns) * len(points)
+        target_keys = np.empty((self.animation_turns, 3), dtype=np.float32)
+        target_keys[:] = target_empty.location
+        target_keys[:, 2] = bbox.z_min + np.arange(self.animation_turns) * turn_increment
+        target_locations = np.repeat(target_keys, len(points), axis=0)   # target location on each frame
+        return camera_locations, target_empty, target_frames, target_keys[:, 2], 'CONSTANT', target_locations
+
+    # ==============================================================================================
+    def _check_sampled_count(self, sampled_count: int) -> None:
+        """Warn the user when the number of sampled camera poses differs from the requested one.
+
+        Arguments:
+            sampled_count {int} -- number of sampled camera poses
+        """
+        if self.images_count != sampled_count:
+            # FIXME is not guaranteed that the total images is exactly the requested
+            msg = "Requested {} frames but sampled only {}!".format(self.images_count, sampled_count)
+            logger.warning(msg)
+            self.report({'WARNING'}, msg)
+
+    # ==============================================================================================
+    # animation type -> animation function
+    _ANIMATORS = {
+        "animtype.helix": _animate_helix,
+        "animtype.hemisphere": _animate_hemisphere,
+        "animtype.circular": _animate_circular,
+        "animtype.circular_up": _animate_circular_up,
+    }   # type: Dict[str, Callable[[SFMFLOW_OT_animate_camera, bpy.types.Object, SceneBoundingBox], AnimationKeys]]
+
 
 #
 #
@@ -326,12 +349,7 @@ class SFMFLOW_OT_animate_camera_clear(bpy.types.Operator):
         Returns:
             set -- {'FINISHED'}
         """
-        camera = context.scene.camera
-        if not camera:
-            msg = "No render camera selected!"
-            logger.error(msg)
-            self.report({'ERROR'}, msg)
-            return {'CANCELLED'}
+        camera = context.scene.camera   # checked by `poll()`
         #
         camera.animation_data_clear()
         #
@@ -1,16 +1,28 @@
 
 import logging
-from random import shuffle
+
+import numpy as np
 
 import bpy
 from mathutils import Vector
 
-from ..utils import SceneBoundingBox
-from ..utils.animation import is_keyframe, sun_animation_points
+from ..utils import SceneBoundingBox, rotation_differences
+from ..utils.animation import RNG, get_keyframes, insert_keyframes, sun_animation_points
 from .init_scene import SFMFLOW_OT_init_scene
 
 logger = logging.getLogger(__name__)
 
+# world's gravity direction
+_GRAVITY_DIRECTION = Vector((0, 0, -1))
+
+# `north_direction` enum value -> north axis direction
+_NORTH_DIRECTIONS = {
+    "north.pos_x": Vector((1, 0, 0)),
+    "north.neg_x": Vector((-1, 0, 0)),
+    "north.pos_y": Vector((0, 1, 0)),
+    "north.neg_y": Vector((0, -1, 0)),
+}
+
 
 class SFMFLOW_OT_animate_sun(bpy.types.Operator):
     """Animate the sun lamp path for SfM dataset generation"""
@@ -143,33 +155,25 @@ class SFMFLOW_OT_animate_sun(bpy.types.Operator):
         logger.info("Animating sun...")
 
         scene = context.scene
-        bbox = SceneBoundingBox(scene)
+        bbox = SceneBoundingBox.get_cached(scene)
         animation_length = self.end_frame - self.start_frame
         #
-        if self.north_direction == "north.pos_x":
-            north_direction = Vector((1, 0, 0))
-        elif self.north_direction == "north.neg_x":
-            north_direction = Vector((-1, 0, 0))
-        elif self.north_direction == "north.neg_y":
-            north_direction = Vector((0, -1, 0))
-        else:  # "north.pos_y"
-            north_direction = Vector((0, 1, 0))
+        north_direction = _NORTH_DIRECTIONS.get(self.north_direction, _NORTH_DIRECTIONS["north.pos_y"])
         #
-        points = sun_animation_points(Vector((0, 0, -1)), north_direction, scene_bbox=bbox,
+        points = sun_animation_points(_GRAVITY_DIRECTION, north_direction, scene_bbox=bbox,
                                       radius=1, points_count=animation_length)
         #
         if self.randomize_pos:
-            shuffle(points)
+            points = points[RNG.permutation(len(points))]
         #
-        no_rotation = bbox.floor_center
         sun = scene.objects["SunDriver"]
         sun.rotation_mode = 'QUATERNION'
-        for i, p in enumerate(points):
-            frame_number = self.start_frame+i
-            if self.overwrite_existing_animation or not is_keyframe(sun, frame_number):
-                rot_diff = no_rotation.rotation_difference(p)
-                sun.rotation_quaternion = rot_diff
-                sun.keyframe_insert("rotation_quaternion", frame=frame_number)
+        frames = np.arange(self.start_frame, self.start_frame + len(points))
+        rotations = rotation_differences(bbox.floor_center, points)
+        if not self.overwrite_existing_animation:
+            keep = ~np.isin(frames, get_keyframes(sun))   # existing keyframes are read once
+            frames, rotations = frames[keep], rotations[keep]
+        insert_keyframes(sun, "rotation_quaternion", frames, rotations)
         #
         logger.info("Sun '%s' animated (length=%i)", sun.name, len(points))
         return {'FINISHED'}
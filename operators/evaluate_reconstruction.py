@@ -9,6 +9,23 @@ from sfm_flow.utils import is_active_object_reconstruction
 
 logger = logging.getLogger(__name__)
 
+# formatter of the float values in the evaluation .csv file
+_format_float = "{:.6f}".format
+
+# scene length unit -> unit symbol used in the evaluation report
+_LENGTH_UNIT = {
+    'ADAPTIVE': "",
+    'METERS': "m",
+    'KILOMETERS': "km",
+    'CENTIMETERS': "cm",
+    'MILLIMETERS': "mm",
+    'MICROMETERS': "μm",
+    'MILES': "mi",
+    'FEET': "ft",
+    'INCHES': "in",
+    'THOU': "mil"
+}
+
 
 class SFMFLOW_OT_evaluate_reconstruction(bpy.types.Operator):
     """Evaluate a 3D reconstruction."""
@@ -17,18 +34,7 @@ class SFMFLOW_OT_evaluate_reconstruction(bpy.types.Operator):
 
     FILENAME = "sfmflow_evaluation.txt"
 
-    LENGTH_UNIT = {
-        'ADAPTIVE': "",
-        'METERS': "m",
-        'KILOMETERS': "km",
-        'CENTIMETERS': "cm",
-        'MILLIMETERS': "mm",
-        'MICROMETERS': "μm",
-        'MILES': "mi",
-        'FEET': "ft",
-        'INCHES': "in",
-        'THOU': "mil"
-    }
+    LENGTH_UNIT = _LENGTH_UNIT
 
     ################################################################################################
     # Properties
@@ -125,7 +131,7 @@ class SFMFLOW_OT_evaluate_reconstruction(bpy.types.Operator):
         """
         obj = context.view_layer.objects.active
         model = ReconstructionsManager.get_model_by_uuid(obj['sfmflow_model_uuid'])
-        result = model.evaluate(context.scene, ReconstructionsManager.gt_kdtree, self.use_filtered_cloud)
+        result = model.evaluate(context.scene, ReconstructionsManager.get_gt_kdtree(), self.use_filtered_cloud)
         #
         # build full evaluation result dictionary
         out_data = {
@@ -135,59 +141,61 @@ class SFMFLOW_OT_evaluate_reconstruction(bpy.types.Operator):
             "name_internal": model.name,
             "project_name": bpy.path.basename(bpy.data.filepath),
         }
-        out_data.update({f'pc_{k}': ("{:.6f}".format(v) if isinstance(v, float) else v) for k, v in result[0].items()})
-        out_data.update({f'cam_{k}': ("{:.6f}".format(v) if isinstance(v, float) else v) for k, v in result[1].items()})
+        for prefix, values in (("pc_", result[0]), ("cam_", result[1])):
+            out_data.update({prefix + k: (_format_float(v) if isinstance(v, float) else v) for k, v in values.items()})
         #
         len_scale = context.scene.unit_settings.scale_length
-        len_unit = SFMFLOW_OT_evaluate_reconstruction.LENGTH_UNIT[context.scene.unit_settings.length_unit]
+        len_unit = _LENGTH_UNIT[context.scene.unit_settings.length_unit]
         flags = 'w' if self.overwrite_evaluation_file else 'a'
         try:
             # write .txt file
             filepath = bpy.path.abspath(self.evaluation_filepath)
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            with open(filepath, mode=flags) as f:
-                f.write("Project: {}\n".format(out_data["project_name"]))
-                f.write("Evaluation of Reconstruction model '{}' (internal name '{}')\n".format(
-                    out_data["name"], out_data["name_internal"]))
-                f.write("Scene measurement system: {}\n".format(out_data["unit_system"]))
-                f.write("Scene length unit: {}\n".format(out_data["length_unit"]))
+            out_pc = result[0]
+            out_cam = result[1]
+            report = (
+                "Project: {}\n".format(out_data["project_name"]),
+                "Evaluation of Reconstruction model '{}' (internal name '{}')\n".format(
+                    out_data["name"], out_data["name_internal"]),
+                "Scene measurement system: {}\n".format(out_data["unit_system"]),
+                "Scene length unit: {}\n".format(out_data["length_unit"]),
                 #
-                f.write("Point cloud evaluation:\n")
-                out_pc = result[0]
-                f.write("   used filtered point cloud: {}\n".format(out_pc['used_filtered_cloud']))
-                f.write("   filter threshold: {:.3f}\n".format(out_pc['filter_threshold']))
-                f.write("   full cloud size: {}\n".format(out_pc['full_cloud_size']))
-                f.write("   evaluated cloud size: {} ({:.1f}%)\n".format(
-                    out_pc['used_cloud_size'], out_pc['used_cloud_size_percent']*100))
-                f.write("   discarded points count: {}\n".format(out_pc['discarded_points']))
-                f.write("   distance mean: {:.3f}{}\n".format(out_pc['dist_mean']*len_scale, len_unit))
-                f.write("   distance standard deviation: {:.3f}{}\n".format(out_pc['dist_std']*len_scale, len_unit))
-                f.write("   distance min: {:.3f}{}\n".format(out_pc['dist_min']*len_scale, len_unit))
-                f.write("   distance max: {:.3f}{}\n".format(out_pc['dist_max']*len_scale, len_unit))
+                "Point cloud evaluation:\n",
+                "   used filtered point cloud: {}\n".format(out_pc['used_filtered_cloud']),
+                "   filter threshold: {:.3f}\n".format(out_pc['filter_threshold']),
+                "   full cloud size: {}\n".format(out_pc['full_cloud_size']),
+                "   evaluated cloud size: {} ({:.1f}%)\n".format(
+                    out_pc['used_cloud_size'], out_pc['used_cloud_size_percent']*100),
+                "   discarded points count: {}\n".format(out_pc['discarded_points']),
+                "   distance mean: {:.3f}{}\n".format(out_pc['dist_mean']*len_scale, len_unit),
+                "   distance standard deviation: {:.3f}{}\n".format(out_pc['dist_std']*len_scale, len_unit),
+                "   distance min: {:.3f}{}\n".format(out_pc['dist_min']*len_scale, len_unit),
+                "   distance max: {:.3f}{}\n".format(out_pc['dist_max']*len_scale, len_unit),
                 #
-                f.write("Camera poses evaluation:\n")
-                out_cam = result[1]
-                f.write("   cameras count: {}\n".format(out_cam['camera_count']))
-                f.write("   reconstructed camera count: {} ({:.1f}%)\n".format(
-                    out_cam['reconstructed_camera_count'], out_cam['reconstructed_camera_percent']*100))
-                f.write("   distance mean: {:.3f}{}\n".format(out_cam['pos_mean']*len_scale, len_unit))
-                f.write("   distance standard deviation: {:.3f}{}\n".format(out_cam['pos_std']*len_scale, len_unit))
-                f.write("   distance min: {:.3f}{}\n".format(out_cam['pos_min']*len_scale, len_unit))
-                f.write("   distance max: {:.3f}{}\n".format(out_cam['pos_max']*len_scale, len_unit))
-                f.write("   rotation difference mean: {:.3f}°\n".format(out_cam['rot_mean']))
-                f.write("   rotation difference standard deviation: {:.3f}°\n".format(out_cam['rot_std']))
-                f.write("   rotation difference min: {:.3f}°\n".format(out_cam['rot_min']))
-                f.write("   rotation difference max: {:.3f}°\n".format(out_cam['rot_max']))
-                f.write("   look-at direction difference mean: {:.3f}°\n".format(out_cam['lookat_mean']))
-                f.write("   look-at direction difference standard deviation: {:.3f}°\n".format(out_cam['lookat_std']))
-                f.write("   look-at direction difference min: {:.3f}°\n".format(out_cam['lookat_min']))
-                f.write("   look-at direction difference max: {:.3f}°\n".format(out_cam['lookat_max']))
+                "Camera poses evaluation:\n",
+                "   cameras count: {}\n".format(out_cam['camera_count']),
+                "   reconstructed camera count: {} ({:.1f}%)\n".format(
+                    out_cam['reconstructed_camera_count'], out_cam['reconstructed_camera_percent']*100),
+                "   distance mean: {:.3f}{}\n".format(out_cam['pos_mean']*len_scale, len_unit),
+                "   distance standard deviation: {:.3f}{}\n".format(out_cam['pos_std']*len_scale, len_unit),
+                "   distance min: {:.3f}{}\n".format(out_cam['pos_min']*len_scale, len_unit),
+                "   distance max: {:.3f}{}\n".format(out_cam['pos_max']*len_scale, len_unit),
+                "   rotation difference mean: {:.3f}°\n".format(out_cam['rot_mean']),
+                "   rotation difference standard deviation: {:.3f}°\n".format(out_cam['rot_std']),
+                "   rotation difference min: {:.3f}°\n".format(out_cam['rot_min']),
+                "   rotation difference max: {:.3f}°\n".format(out_cam['rot_max']),
+                "   look-at direction difference mean: {:.3f}°\n".format(out_cam['lookat_mean']),
+                "   look-at direction difference standard deviation: {:.3f}°\n".format(out_cam['lookat_std']),
+                "   look-at direction difference min: {:.3f}°\n".format(out_cam['lookat_min']),
+                "   look-at direction difference max: {:.3f}°\n".format(out_cam['lookat_max']),
                 #
-                f.write("\n\n")
-            #
-            # write .csv file
-            csv_filepath = bpy.path.abspath(self.evaluation_filepath)[:-3] + "csv"
-            with open(csv_filepath, flags, newline='') as csv_f:
+                "\n\n",
+            )
+            csv_filepath = filepath[:-3] + "csv"   # same name of the .txt file
+            with open(filepath, mode=flags) as f, open(csv_filepath, flags, newline='') as csv_f:
+                f.write("".join(report))   # single buffered write
+                #
+                # write .csv file
                 writer = DictWriter(csv_f, fieldnames=out_data.keys())
                 if csv_f.tell() == 0:
                     writer.writeheader()
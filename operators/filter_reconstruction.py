@@ -79,7 +79,7 @@ class SFMFLOW_OT_reconstruction_filter(bpy.types.Operator):
         """
         obj = context.view_layer.objects.active
         model = ReconstructionsManager.get_model_by_uuid(obj['sfmflow_model_uuid'])
-        model.filter_model(ReconstructionsManager.gt_kdtree, self.filter_distance_threshold)
+        model.filter_model(ReconstructionsManager.get_gt_kdtree(), self.filter_distance_threshold)
         return {'FINISHED'}
 
 
@@ -2,13 +2,14 @@
 import logging
 import os
 from pathlib import Path
-from typing import List
+
+import numpy as np
 
 import bpy
 from bpy_extras.io_utils import ImportHelper
-from mathutils import Vector
 from sfm_flow.operators.sample_geometry_gt import SFMFLOW_OT_sample_geometry_gt
 from sfm_flow.reconstruction import ReconstructionBase, ReconstructionsManager
+from sfm_flow.utils import add_vertices_mesh
 
 logger = logging.getLogger(__name__)
 
@@ -90,15 +91,10 @@ class SFMFLOW_OT_import_reconstruction(bpy.types.Operator, ImportHelper):
 
     # ==============================================================================================
     @staticmethod
-    def show_sampled_points(points: List[Vector]) -> None:
+    def show_sampled_points(points: np.ndarray) -> None:
         """Show a sampled point cloud. NOTE only for debug!
 
         Arguments:
-            points {List[Vector]} -- point cloud
+            points {np.ndarray} -- point cloud, float32 array of shape (N, 3)
         """
-        mesh = bpy.data.meshes.new("sampled_data")
-        obj = bpy.data.objects.new("sampled", mesh)
-        bpy.context.scene.collection.objects.link(obj)
-        #
-        mesh.from_pydata(points, [], [])
-        mesh.update()
+        add_vertices_mesh("sampled", points)
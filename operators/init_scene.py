@@ -4,6 +4,8 @@ from collections import namedtuple
 from math import pi
 from random import random
 
+import numpy as np
+
 import addon_utils
 import bpy
 from mathutils import Euler, Vector
@@ -15,6 +17,8 @@ from ..utils.nodes import add_floor_material_nodes
 
 logger = logging.getLogger(__name__)
 
+PointLight = namedtuple("light", "name offset type colorRGBA strength")
+
 
 class SFMFLOW_OT_init_scene(bpy.types.Operator):
     """Initializes the current scene for SfM dataset generation"""
@@ -28,6 +32,14 @@ class SFMFLOW_OT_init_scene(bpy.types.Operator):
     # default sun orientation
     DEFAULT_SUN_ROTATION = Euler((0.9599310755729675, 0.0, 0.2617993950843811), 'XYZ')
 
+    # point lights setup, locations are offsets from the scene center
+    POINT_LIGHTS = (
+        PointLight("Lamp DX - Front", (5.0, -5.0, 5.0), "POINT", (1.0, 1.0, 1.0, 1.0), 250.),    # front dx
+        PointLight("Lamp SX - Front", (-5.0, -5.0, 5.0), "POINT", (1.0, 1.0, 1.0, 1.0), 250.),   # front sx
+        PointLight("Lamp DX - Rear", (5.0, 5.0, 5.0), "POINT", (1.0, 1.0, 1.0, 1.0), 250.),      # rear dx
+        PointLight("Lamp SX - Rear", (-5.0, 5.0, 5.0), "POINT", (1.0, 1.0, 1.0, 1.0), 250.),     # rear sx
+    )
+
     ################################################################################################
     # Properties
     #
@@ -210,87 +222,89 @@ class SFMFLOW_OT_init_scene(bpy.types.Operator):
 
         scene.render.engine = 'CYCLES'                   # switch to path tracing render engine
         scene.unit_settings.system = 'METRIC'            # switch to metric units
+        render = scene.render
+        cycles = scene.cycles
 
     # --- Render option
         if bpy.context.preferences.addons['cycles'].preferences.compute_device_type is not None:
             # CUDA or OpenCL
-            scene.cycles.device = 'GPU'
+            cycles.device = 'GPU'
         else:
             # CPU only
-            scene.cycles.device = 'CPU'
+            cycles.device = 'CPU'
         # images size and aspect ratio
-        scene.render.pixel_aspect_x = 1.0
-        scene.render.pixel_aspect_y = 1.0
-        scene.render.resolution_x = 1920                 # width
-        scene.render.resolution_y = 1080                 # height
-        scene.render.resolution_percentage = 100         # rendering scale
-        scene.render.use_border = False
-        scene.render.use_crop_to_border = False
+        render.pixel_aspect_x = 1.0
+        render.pixel_aspect_y = 1.0
+        render.resolution_x = 1920                       # width
+        render.resolution_y = 1080                       # height
+        render.resolution_percentage = 100               # rendering scale
+        render.use_border = False
+        render.use_crop_to_border = False
         # images metadata
-        scene.render.use_stamp_time = True
-        scene.render.use_stamp_date = True
-        scene.render.use_stamp_render_time = True
-        scene.render.use_stamp_frame = True
-        scene.render.use_stamp_scene = True
-        scene.render.use_stamp_memory = True
-        scene.render.use_stamp_camera = True
-        scene.render.use_stamp_lens = True
-        scene.render.use_stamp_filename = True
+        render.use_stamp_time = True
+        render.use_stamp_date = True
+        render.use_stamp_render_time = True
+        render.use_stamp_frame = True
+        render.use_stamp_scene = True
+        render.use_stamp_memory = True
+        render.use_stamp_camera = True
+        render.use_stamp_lens = True
+        render.use_stamp_filename = True
         # image format
-        scene.render.image_settings.color_mode = 'RGB'
-        scene.render.image_settings.file_format = 'JPEG'
-        scene.render.use_file_extension = True
-        scene.render.use_overwrite = True                # force overwrite, be careful!
-        scene.render.image_settings.quality = 90         # image compression
+        render.image_settings.color_mode = 'RGB'
+        render.image_settings.file_format = 'JPEG'
+        render.use_file_extension = True
+        render.use_overwrite = True                      # force overwrite, be careful!
+        render.image_settings.quality = 90               # image compression
         # post processing
-        scene.render.use_compositing = True
-        scene.render.use_sequencer = False
+        render.use_compositing = True
+        render.use_sequencer = False
         # sampling
-        scene.cycles.progressive = 'BRANCHED_PATH'
-        scene.cycles.seed = 0
-        scene.cycles.sample_clamp_direct = 0
-        scene.cycles.sample_clamp_indirect = 0
-        scene.cycles.light_sampling_threshold = 0.01
-        scene.cycles.aa_samples = 32
-        scene.cycles.preview_aa_samples = 4
-        scene.cycles.sample_all_lights_direct = True
-        scene.cycles.sample_all_lights_indirect = True
-        scene.cycles.diffuse_samples = 3
-        scene.cycles.glossy_samples = 2
-        scene.cycles.transmission_samples = 2
-        scene.cycles.ao_samples = 1
-        scene.cycles.mesh_light_samples = 2
-        scene.cycles.subsurface_samples = 2
-        scene.cycles.volume_samples = 2
-        scene.cycles.sampling_pattern = 'SOBOL'
-        scene.cycles.use_layer_samples = 'USE'
+        cycles.progressive = 'BRANCHED_PATH'
+        cycles.seed = 0
+        cycles.sample_clamp_direct = 0
+        cycles.sample_clamp_indirect = 0
+        cycles.light_sampling_threshold = 0.01
+        cycles.aa_samples = 32
+        cycles.preview_aa_samples = 4
+        cycles.sample_all_lights_direct = True
+        cycles.sample_all_lights_indirect = True
+        cycles.diffuse_samples = 3
+        cycles.glossy_samples = 2
+        cycles.transmission_samples = 2
+        cycles.ao_samples = 1
+        cycles.mesh_light_samples = 2
+        cycles.subsurface_samples = 2
+        cycles.volume_samples = 2
+        cycles.sampling_pattern = 'SOBOL'
+        cycles.use_layer_samples = 'USE'
         # light paths
-        scene.cycles.transparent_max_bounces = 8
-        scene.cycles.transparent_min_bounces = 8
-        scene.cycles.use_transparent_shadows = True
-        scene.cycles.max_bounces = 8
-        scene.cycles.min_bounces = 3
-        scene.cycles.diffuse_bounces = 2
-        scene.cycles.glossy_bounces = 4
-        scene.cycles.transmission_bounces = 8
-        scene.cycles.volume_bounces = 2
-        scene.cycles.caustics_reflective = False
-        scene.cycles.caustics_refractive = False
-        scene.cycles.blur_glossy = 0.00
+        cycles.transparent_max_bounces = 8
+        cycles.transparent_min_bounces = 8
+        cycles.use_transparent_shadows = True
+        cycles.max_bounces = 8
+        cycles.min_bounces = 3
+        cycles.diffuse_bounces = 2
+        cycles.glossy_bounces = 4
+        cycles.transmission_bounces = 8
+        cycles.volume_bounces = 2
+        cycles.caustics_reflective = False
+        cycles.caustics_refractive = False
+        cycles.blur_glossy = 0.00
         # performances
-        scene.render.threads_mode = 'AUTO'
+        render.threads_mode = 'AUTO'
         if bpy.app.version < BlenderVersion.V3_0:  # < v3.0
-            scene.cycles.debug_bvh_type = 'DYNAMIC_BVH'
-            scene.cycles.preview_start_resolution = 64
-            scene.cycles.tile_order = 'HILBERT_SPIRAL'
-            scene.render.tile_x = 64
-            scene.render.tile_y = 64
-            scene.cycles.use_progressive_refine = False
-            scene.render.use_save_buffers = False
-            scene.render.use_persistent_data = False
-        scene.cycles.debug_use_spatial_splits = False
-        scene.cycles.debug_use_hair_bvh = True
-        scene.cycles.debug_bvh_time_steps = 0
+            cycles.debug_bvh_type = 'DYNAMIC_BVH'
+            cycles.preview_start_resolution = 64
+            cycles.tile_order = 'HILBERT_SPIRAL'
+            render.tile_x = 64
+            render.tile_y = 64
+            cycles.use_progressive_refine = False
+            render.use_save_buffers = False
+            render.use_persistent_data = False
+        cycles.debug_use_spatial_splits = False
+        cycles.debug_use_hair_bvh = True
+        cycles.debug_bvh_time_steps = 0
 
     # -- Color Management
         scene.view_settings.view_transform = "Standard"
@@ -336,13 +350,20 @@ class SFMFLOW_OT_init_scene(bpy.types.Operator):
         environment_collection.objects.link(sphere)
         bpy.context.collection.objects.unlink(sphere)   # sphere is created in the active collection, unlink and relink
         #
-        # give the sphere a flat "floor"
+        # give the sphere a flat "floor", all the vertices are read and written at once
         offset = 0.0001
-        for vertex in sphere.data.vertices:
-            v_world = sphere.matrix_world @ vertex.co   # sphere vertices are in obj space, move to world space
-            if v_world.z < bbox.z_min:            # set Z=min(Z) to every vertex with Z<min(Z)
-                v_world.z = bbox.z_min - offset   # tolerance to avoid z-fighting
-            vertex.co = sphere.matrix_world.inverted() @ v_world  # move back to obj space
+        vertices = sphere.data.vertices
+        co = np.empty(len(vertices) * 3, dtype=np.float32)
+        vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3)
+        mw = np.array(sphere.matrix_world)
+        v_world = co @ mw[:3, :3].T + mw[:3, 3]   # sphere vertices are in obj space, move to world space
+        below = v_world[:, 2] < bbox.z_min         # set Z=min(Z) to every vertex with Z<min(Z)
+        v_world[below, 2] = bbox.z_min - offset    # tolerance to avoid z-fighting
+        mw_inv = np.array(sphere.matrix_world.inverted())
+        co[below] = v_world[below] @ mw_inv[:3, :3].T + mw_inv[:3, 3]   # move back to obj space
+        vertices.foreach_set("co", co.ravel())
+        sphere.data.update()
         sphere.data.flip_normals()
         #
         # setup wall material
@@ -371,22 +392,15 @@ class SFMFLOW_OT_init_scene(bpy.types.Operator):
         bbox = self.scene_bbox
         environment_collection = get_environment_collection()
         #
-        Light = namedtuple("light", "name location type colorRGBA strength")
-        lights = (
-            Light("Lamp DX - Front", (bbox.center.x + 5.0, bbox.center.y - 5.0, bbox.center.z + 5.0),
-                  "POINT", (1.0, 1.0, 1.0, 1.0), 250.),    # front dx
-            Light("Lamp SX - Front", (bbox.center.x - 5.0, bbox.center.y - 5.0, bbox.center.z + 5.0),
-                  "POINT", (1.0, 1.0, 1.0, 1.0), 250.),    # front sx
-            Light("Lamp DX - Rear", (bbox.center.x + 5.0, bbox.center.y + 5.0, bbox.center.z + 5.0),
-                  "POINT", (1.0, 1.0, 1.0, 1.0), 250.),    # rear dx
-            Light("Lamp SX - Rear", (bbox.center.x - 5.0, bbox.center.y + 5.0, bbox.center.z + 5.0),
-                  "POINT", (1.0, 1.0, 1.0, 1.0), 250.)     # rear sx
-        )
-        for light in lights:
-            lamp_data = bpy.data.lights.new(name=light.name, type=light.type)            # new lamp datablock
-            lamp_object = bpy.data.objects.new(name=light.name, object_data=lamp_data)   # new lamp object
-            environment_collection.objects.link(lamp_object)
-            lamp_object.location = light.location
+        cx, cy, cz = bbox.center
+        new_light = bpy.data.lights.new
+        new_object = bpy.data.objects.new
+        link = environment_collection.objects.link
+        for light in SFMFLOW_OT_init_scene.POINT_LIGHTS:
+            lamp_data = new_light(name=light.name, type=light.type)                # new lamp datablock
+            lamp_object = new_object(name=light.name, object_data=lamp_data)       # new lamp object
+            link(lamp_object)
+            lamp_object.location = (cx + light.offset[0], cy + light.offset[1], cz + light.offset[2])
             lamp_object.color = light.colorRGBA
             lamp_data.energy = light.strength   # lamp strength in Watt
         #
@@ -404,30 +418,30 @@ class SFMFLOW_OT_init_scene(bpy.types.Operator):
         """
         logger.info("Initializing camera: %s", camera.name)
         #
-        camera.scale[0] = 1.0
-        camera.scale[1] = 1.0
-        camera.scale[2] = 1.0
+        camera.scale = (1.0, 1.0, 1.0)
+        cam_data = camera.data
+        dof = cam_data.dof
         # lens
-        camera.data.type = 'PERSP'
-        camera.data.lens = 35.0                  # focal length in millimeters
-        camera.data.lens_unit = 'MILLIMETERS'
-        camera.data.shift_x = 0.000
-        camera.data.shift_y = 0.000
-        camera.data.clip_start = 0.100
-        camera.data.clip_end = 100.0
+        cam_data.type = 'PERSP'
+        cam_data.lens = 35.0                  # focal length in millimeters
+        cam_data.lens_unit = 'MILLIMETERS'
+        cam_data.shift_x = 0.000
+        cam_data.shift_y = 0.000
+        cam_data.clip_start = 0.100
+        cam_data.clip_end = 100.0
         # sensor
-        camera.data.sensor_width = 32            # sensor width in millimeters
-        camera.data.sensor_height = 18           # sensor height in millimeters
-        camera.data.sensor_fit = 'HORIZONTAL'
+        cam_data.sensor_width = 32            # sensor width in millimeters
+        cam_data.sensor_height = 18           # sensor height in millimeters
+        cam_data.sensor_fit = 'HORIZONTAL'
         # display
-        camera.data.show_limits = True
-        camera.data.display_size = 0.50
+        cam_data.show_limits = True
+        cam_data.display_size = 0.50
         # depth of field
-        camera.data.dof.aperture_fstop = 2.8
-        camera.data.dof.aperture_blades = 0
-        camera.data.dof.aperture_rotation = 0.0
-        camera.data.dof.aperture_ratio = 1.0
-        camera.data.dof.focus_distance = camera_detect_dof_distance(view_layer, camera, scene)
+        dof.aperture_fstop = 2.8
+        dof.aperture_blades = 0
+        dof.aperture_rotation = 0.0
+        dof.aperture_ratio = 1.0
+        dof.focus_distance = camera_detect_dof_distance(view_layer, camera, scene)
         #
         logger.info("Camera initialized")
 
@@ -457,11 +471,17 @@ class SFMFLOW_OT_init_scene(bpy.types.Operator):
         plane_size = max(self.scene_bbox.width, self.scene_bbox.height) * 400
         environment_collection = get_environment_collection()
         #
-        bpy.ops.mesh.primitive_plane_add(size=plane_size, location=self.scene_bbox.floor_center)
-        floor = bpy.context.active_object
-        floor.name = "Floor"
+        # build the plane data directly and link it only to the environment collection,
+        # avoids the operator call and the link/unlink from the active collection
+        half_size = plane_size / 2
+        mesh = bpy.data.meshes.new("Floor")
+        mesh.from_pydata(((-half_size, -half_size, 0.), (half_size, -half_size, 0.),
+                          (half_size, half_size, 0.), (-half_size, half_size, 0.)), [], ((0, 1, 2, 3),))
+        mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", (0., 0., 1., 0., 1., 1., 0., 1.))
+        mesh.update()
+        floor = bpy.data.objects.new("Floor", mesh)
+        floor.location = self.scene_bbox.floor_center
         environment_collection.objects.link(floor)
-        bpy.context.collection.objects.unlink(floor)   # floor is created in the active collection, unlink and relink
         #
         # setup floor material
         material = bpy.data.materials.new("Floor")
@@ -1,11 +1,11 @@
 
 import logging
-from typing import List
+
+import numpy as np
 
 import bpy
-from mathutils import Vector
 from sfm_flow.reconstruction import ReconstructionsManager
-from sfm_flow.utils import get_objs, sample_points_on_mesh
+from sfm_flow.utils import add_vertices_mesh, get_objs, sample_points_on_mesh
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +55,7 @@ class SFMFLOW_OT_sample_geometry_gt(bpy.types.Operator):
 
     # ==============================================================================================
     @staticmethod
-    def sample_geometry_gt_points(scene: bpy.types.Scene) -> List[Vector]:
+    def sample_geometry_gt_points(scene: bpy.types.Scene) -> np.ndarray:
         """Sample ground truth point cloud on all objects that are not part of the
         `SfM_Environment` and `SfM_Reconstructions` collections.
 
@@ -63,7 +63,7 @@ class SFMFLOW_OT_sample_geometry_gt(bpy.types.Operator):
             scene {bpy.types.Scene} -- scene to sample
 
         Returns:
-            List[Vector] -- ground truth point cloud
+            np.ndarray -- ground truth point cloud, float32 array of shape (N, 3)
         """
         gt_objs = get_objs(scene, exclude_collections=("SfM_Environment", "SfM_Reconstructions"))
         gt_points = sample_points_on_mesh(gt_objs)
@@ -72,14 +72,10 @@ class SFMFLOW_OT_sample_geometry_gt(bpy.types.Operator):
 
     # ==============================================================================================
     @staticmethod
-    def _show_sampled_points(points: List[Vector]) -> None:
+    def _show_sampled_points(points: np.ndarray) -> None:
         """Show a sampled point cloud. Only for debug!
 
         Arguments:
-            points {List[Vector]} -- point cloud
+            points {np.ndarray} -- point cloud
         """
-        mesh = bpy.data.meshes.new("sampled_data")
-        obj = bpy.data.objects.new("sampled", mesh)
-        bpy.context.scene.collection.objects.link(obj)
-        mesh.from_pydata(points, [], [])
-        mesh.update()
+        add_vertices_mesh("sampled", points)
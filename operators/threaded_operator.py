@@ -37,6 +37,9 @@ class ThreadedOperator(bpy.types.Operator):
         # progress message to show in the status bar
         self.progress_string = None   # type: str
 
+        # progress message currently shown in the status bar, used to skip redundant updates
+        self._shown_progress_string = None   # type: str
+
         # thread exit code, MUST be set before the end of `heavy_load()`. 0=execution ok, otherwise errors
         self.exit_code = None         # type: int
 
@@ -62,12 +65,14 @@ class ThreadedOperator(bpy.types.Operator):
             set -- {'PASS_THROUGH'}
         """
         if event.type == 'TIMER':
-            if self.progress_string:
+            if self.progress_string and self.progress_string != self._shown_progress_string:
                 context.workspace.status_text_set(self.progress_string)
+                self._shown_progress_string = self.progress_string
             #
             if self.exit_code is not None:           # process terminated
                 if self._progress_delay_counter > 10:
                     self.progress_string = None
+                    self._shown_progress_string = None
                     self.exit_code = None
                     self._progress_delay_counter = 0
                     context.window_manager.event_timer_remove(self._timer)
@@ -5,6 +5,10 @@ import bpy
 
 from ..utils import get_objs
 
+# items of the `reconstruction_pipeline` enum and the pipelines configuration they were built from.
+# Python must also keep a reference to the dynamic enum items, otherwise Blender may show invalid strings
+_PIPELINES_ITEMS_CACHE = [None, []]   # type: List
+
 
 class SFMFLOW_AddonProperties(bpy.types.PropertyGroup):
     """Add-on's scene data type definition."""
@@ -92,6 +96,12 @@ class SFMFLOW_AddonProperties(bpy.types.PropertyGroup):
         """
         addon_user_preferences_name = (__name__)[:__name__.index('.')]
         prefs = context.preferences.addons[addon_user_preferences_name].preferences  # type: AddonPreferences
+        #
+        # the items are rebuilt only when the configured pipelines change, this is called on each redraw
+        key = (bool(prefs.colmap_path), bool(prefs.openmvg_path), bool(prefs.theia_path), bool(prefs.visualsfm_path),
+               tuple((cp.uuid, cp.name, cp.command) for cp in prefs.custom_pipelines))
+        if key == _PIPELINES_ITEMS_CACHE[0]:
+            return _PIPELINES_ITEMS_CACHE[1]
         items = []
         #
         # default pipelines
@@ -112,6 +122,7 @@ class SFMFLOW_AddonProperties(bpy.types.PropertyGroup):
             items.append((cp.uuid, cp.name, cp.command))
         #
         items.sort(key=lambda t: t[1])   # sort by name
+        _PIPELINES_ITEMS_CACHE[:] = (key, items)
         return items
 
     reconstruction_pipeline: bpy.props.EnumProperty(
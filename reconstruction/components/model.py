@@ -5,9 +5,11 @@ from statistics import mean, stdev
 from typing import Dict, List, Tuple
 from uuid import uuid1
 
+import numpy as np
+
 import bgl
 import bpy
-from mathutils import Matrix, Vector
+from mathutils import Matrix
 from mathutils.kdtree import KDTree
 from sfm_flow.utils import get_reconstruction_collection
 
@@ -105,12 +107,12 @@ class ReconModel():
         context.view_layer.objects.active = self._ui_control_empty
 
     # ==============================================================================================
-    def register_model(self, target_pc: List[Vector], gt_kdtree: KDTree, max_iterations: int = None,
+    def register_model(self, target_pc: np.ndarray, gt_kdtree: KDTree, max_iterations: int = None,
                        samples: int = None, use_filtered_cloud: bool = True) -> float:
         """Register the model to the ground truth.
 
         Arguments:
-            target_pc {List[Vector]} -- target/reference point cloud
+            target_pc {np.ndarray} -- target/reference point cloud, shape (N, 3)
 
         Keyword Arguments:
             max_iterations {int} -- number of iteration allowed (default: {None} 1% of point cloud size, min 100)
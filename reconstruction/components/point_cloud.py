@@ -1,8 +1,6 @@
 
 import logging
 from functools import reduce
-from random import shuffle
-from statistics import mean, stdev
 from typing import Dict, List, Tuple, Union
 
 import numpy as np
@@ -12,10 +10,13 @@ from gpu.types import GPUShader
 from gpu_extras.batch import batch_for_shader
 from mathutils import Color, Matrix, Vector
 from mathutils.kdtree import KDTree
-from sfm_flow.utils import euclidean_distance
+from sfm_flow.utils import add_vertices_mesh
 
 logger = logging.getLogger(__name__)
 
+# 4x4 identity, used to skip no-op transformations
+_IDENTITY_MATRIX = np.identity(4)
+
 
 class PointCloud():
     """Point cloud representation.
@@ -197,13 +198,7 @@ class PointCloud():
         Keyword Arguments:
             vertices {Union[np.array, List[Vector]]} -- optional list of vertices to show (default: {None})
         """
-        mesh = bpy.data.meshes.new("pc_vertices_data")
-        obj = bpy.data.objects.new("pc_vertices", mesh)
-        bpy.context.scene.collection.objects.link(obj)
-        #
-        vts = self.vertices if vertices is None else [tuple(v[0:3]) for v in vertices]
-        mesh.from_pydata(vts, [], [])
-        mesh.update()
+        add_vertices_mesh("pc_vertices", self.vertices if vertices is None else vertices)
 
     # ==============================================================================================
     def filter_point_cloud(self, target_pc_kdtree: KDTree, initial_alignment: Matrix,
@@ -220,18 +215,16 @@ class PointCloud():
             np.array -- the filtered point cloud
         """
         logger.info("Starting reconstructed point cloud filtering")
-        src = np.copy(self.vertices)
         #
-        # initial alignment
-        src = PointCloud.transform(src, initial_alignment)
+        # initial alignment, `transform` returns a new array so the cloud is not modified
+        src = PointCloud.transform(self.vertices, initial_alignment)
         #
         # filter distant points
         self._discard_vertices.clear()
         self._filter_distance = distance_threshold
-        to_delete = []
-        for i, v in enumerate(src):
-            if target_pc_kdtree.find(v)[2] > distance_threshold:
-                to_delete.append(i)
+        find = target_pc_kdtree.find
+        d = np.fromiter((find(v)[2] for v in src), dtype=np.float64, count=len(src))
+        to_delete = np.flatnonzero(d > distance_threshold).tolist()
         src = np.delete(src, to_delete, axis=0)
         self._discard_vertices = to_delete
         logger.info("Reconstructed points filtered. Discarded %i points!", len(to_delete))
@@ -240,7 +233,7 @@ class PointCloud():
         return self.vertices_filtered
 
     # ==============================================================================================
-    def get_regsitration_to_target(self, target_pc: List[Vector], initial_alignment: Matrix,
+    def get_regsitration_to_target(self, target_pc: np.ndarray, initial_alignment: Matrix,
                                    target_pc_kdtree: KDTree = None,
                                    max_iterations: int = 100, samples: int = 0,
                                    use_filtered_cloud: bool = True) -> Tuple[Matrix, float]:
@@ -248,7 +241,7 @@ class PointCloud():
         Implements a variant of the Iterative Closest Point algorithm.
 
         Arguments:
-            target_pc {List[Vector]} -- the point cloud to align to
+            target_pc {np.ndarray} -- the point cloud to align to, shape (N, 3)
             initial_alignment {Matrix} -- initial manual alignment, usually from the UI control empty
 
         Keyword Arguments:
@@ -267,51 +260,45 @@ class PointCloud():
         logger.info("Starting ICP, samples=%i, max_iterations=%i", samples, max_iterations)
         src_pc = self.vertices_filtered if use_filtered_cloud else self.vertices
         #
-        target_pc = np.array(target_pc)
-        src = np.ones((src_pc.shape[0], 4))
-        target = np.ones((len(target_pc), 4))
-        src[:, :3] = np.copy(src_pc)
-        target[:, :3] = np.copy(target_pc)
-        #
-        # initial alignment
-        src = PointCloud.transform(src, initial_alignment)
+        # clouds are kept as Nx3 buffers, the initial alignment writes directly into a new source buffer.
+        # the target stays float32 (no copy of the ground truth), the fit is upcast and solved in float64
+        target = np.asarray(target_pc, dtype=np.float32)
+        src = PointCloud.transform(src_pc, initial_alignment)
         #
         # build KDTree for target point cloud
         kdtree = target_pc_kdtree
         if kdtree is None:
-            size = len(target_pc)
+            size = len(target)
             kdtree = KDTree(size)
-            for i, v in enumerate(target_pc):
+            for i, v in enumerate(target):
                 kdtree.insert(v, i)
             kdtree.balance()
         #
         # define samples
-        if samples <= 0 or samples > src[:].shape[0]:
-            logger.warning("Using %i points but were required %i!", src[:].shape[0], samples)
-            samples = src[:].shape[0]
-        #
-        # randomize points
-        indices = list(range(0, src[:].shape[0]))
+        if samples <= 0 or samples > src.shape[0]:
+            logger.warning("Using %i points but were required %i!", src.shape[0], samples)
+            samples = src.shape[0]
         #
+        find = kdtree.find
         current_iter = 0
         previous_error = float('inf')
         transforms = []
         while current_iter < max_iterations:
-            shuffle(indices)
-            s = list(zip(*[kdtree.find(src[i][0:3]) for i in indices[:samples]]))
-            # s_vertices = s[0]
-            s_indices = s[1]
-            s_distances = s[2]
+            # random points and their nearest neighbors in the target cloud
+            src_samples = src[np.random.permutation(src.shape[0])[:samples]]
+            _, s_indices, s_distances = zip(*map(find, src_samples))
+            s_indices = np.array(s_indices, dtype=np.int64)
+            s_distances = np.array(s_distances, dtype=np.float64)
             #
             # get error
-            mean_error = np.mean(s_distances)
+            mean_error = s_distances.mean()
             logger.info("ICP iteration %i, mean error: %f", current_iter, mean_error)
             if (previous_error - mean_error) < 0.0001:   # best alignment reached
                 break
             previous_error = mean_error
             #
             # find fit transform
-            T = self.find_fit_transform(src[indices[:len(s_indices)]], target[s_indices, :])
+            T = self.find_fit_transform(src_samples, target[s_indices])
             transforms.append(T)
             #
             # update the current source cloud
@@ -333,9 +320,10 @@ class PointCloud():
             trg {np.array} -- target point cloud, to align to
 
         Returns:
-            np.matrix -- best alignment transform matrix
+            np.matrix -- best alignment transform matrix, in homogeneous coordinates
         """
         d = src.shape[1]
+        trg = trg.astype(np.float64)   # samples of the float32 target, solve in double precision
         #
         # align centroids
         centroid_trg = np.mean(trg, axis=0)
@@ -352,12 +340,13 @@ class PointCloud():
             R = vh.T @ u.T
         #
         # compute translation
-        t = centroid_trg.T[0:3] - (R @ centroid_src.T)[0:3]
+        t = centroid_trg - (R @ centroid_src)
         #
         # build transformation matrix
-        T = R
-        T[:3, 3] = t
-        return np.array(T)
+        T = np.identity(d + 1)
+        T[:d, :d] = R
+        T[:d, d] = t
+        return T
 
     # ==============================================================================================
     @staticmethod
@@ -377,25 +366,25 @@ class PointCloud():
         """
         assert vertices.shape[1] == 3 or vertices.shape[1] == 4
         #
-        if isinstance(m, Matrix):   # convert to numpy if needed
-            m = np.array(m)
+        m = np.asarray(m, dtype=np.float64)   # no copy if already a float64 array, direct conversion from Matrix
         if m.shape != (4, 4):
             raise ValueError("Transformation matrix must be of shape 4x4! (given {})".format(m.shape))
         if vertices.shape[1] == 3:
-            src = np.ones((vertices.shape[0], 4))
-            src[:, :3] = np.copy(vertices)
-        else:
-            src = np.copy(vertices)
+            if np.array_equal(m, _IDENTITY_MATRIX):   # e.g. no initial alignment, just return a copy
+                return vertices.astype(np.float64)
+            # 3D vectors, apply linear part and translation to all the vertices at once,
+            # the translation is added in-place to avoid a second temporary array
+            src = vertices @ m[:3, :3].T
+            src += m[:3, 3]
+            if np.any(m[3] != (0., 0., 0., 1.)):   # projective transform, w != 1
+                src /= (vertices @ m[3, :3] + m[3, 3])[:, np.newaxis]   # x/w, y/w, z/w
+            return src
         #
-        for i, v in enumerate(src):
-            v_new = m @ v
-            src[i, :-1] = np.array([c / v_new[-1] for c in v_new[:-1]])   # x/w, y/w, z/w
-            src[i, -1] = 1.
-        #
-        # self._show_as_vertices_mesh()
-        if vertices.shape[1] == 3:
-            return src[:, :-1]   # go back to 3D vectors
-        return src               # keep 4D vectors
+        # 4D vectors, normalize to w=1
+        h = vertices @ m.T
+        src = np.ones(h.shape)
+        src[:, :-1] = h[:, :-1] / h[:, -1:]   # x/w, y/w, z/w
+        return src
 
     # ==============================================================================================
     def evaluate(self, target_pc_kdtree: KDTree, use_filtered_cloud: bool) -> Dict:
@@ -426,15 +415,15 @@ class PointCloud():
         # initial alignment
         src = PointCloud.transform(src_pc, self._object_matrix @ self._initial_centroid_matrix)
         #
-        # get distances
-        d = [euclidean_distance(v, target_pc_kdtree.find(v)[0]) for v in src]  # no need to normalize points are 3D
-        # d = [target_pc_kdtree.find(v)[2] for v in src]
+        # get distances, the KDTree already returns the distance to the nearest point
+        find = target_pc_kdtree.find
+        d = np.fromiter((find(v)[2] for v in src), dtype=np.float64, count=len(src))
         #
         # compute statistics
-        d_mean = mean(d)
-        d_std = stdev(d, d_mean) if len(d) > 1 else 0.
-        d_min = min(d)
-        d_max = max(d)
+        d_mean = float(d.mean())
+        d_std = float(d.std(ddof=1)) if len(d) > 1 else 0.   # sample standard deviation
+        d_min = float(d.min())
+        d_max = float(d.max())
         #
         results = {
             "dist_mean": d_mean,
@@ -1,6 +1,9 @@
 
 import logging
-from typing import List, Optional
+import threading
+from typing import Dict, List, Optional, Union
+
+import numpy as np
 
 import bpy
 from mathutils import Vector
@@ -16,8 +19,13 @@ class ReconstructionsManager:
     """Class to handle global access to the 3D reconstruction imported by the user."""
 
     reconstructions = []   # type: List[ReconstructionBase]
-    gt_points = None       # type: List[Vector]
+    gt_points = None       # type: np.ndarray
     gt_kdtree = None       # type: KDTree
+    gt_points_voxel = {}   # type: Dict[float, np.ndarray]
+    gt_kdtree_voxel = {}   # type: Dict[float, KDTree]
+
+    # guards the ground truth caches, these are accessed also by threaded operators
+    _gt_lock = threading.RLock()
 
     ################################################################################################
     # Methods
@@ -37,22 +45,88 @@ class ReconstructionsManager:
 
     # ==============================================================================================
     @classmethod
-    def set_gt_points(cls, gt_points: List[Vector] = None) -> None:
-        """Set the ground truth point cloud. Automatically creates the KDTree to speed up point cloud operations.
+    def set_gt_points(cls, gt_points: Union[np.ndarray, List[Vector]] = None) -> None:
+        """Set the ground truth point cloud, stored as a contiguous float32 array of shape (N, 3).
+        The KDTree used to speed up point cloud operations is built on first use, see `get_gt_kdtree()`.
 
         Keyword Arguments:
-            gt_points {List[Vector]} -- ground truth point cloud. If {None} both the point cloud
-                                        and the KDTree are cleared. (default: {None})
+            gt_points {Union[np.ndarray, List[Vector]]} -- ground truth point cloud. If {None} both the point
+                                                           cloud and the KDTree are cleared. (default: {None})
         """
         cls.unload_deleted()
         #
-        cls.gt_points = gt_points
-        if gt_points is not None:
-            # build KDTree for target point cloud to speed up the nearest neighbor search
-            cls.gt_kdtree = KDTree(len(gt_points))
-            for i, v in enumerate(gt_points):
-                cls.gt_kdtree.insert(v, i)
-            cls.gt_kdtree.balance()
+        with cls._gt_lock:
+            if gt_points is not None:
+                gt_points = np.ascontiguousarray(gt_points, dtype=np.float32).reshape(-1, 3)
+            cls.gt_points = gt_points
+            cls.gt_points_voxel = {}   # downsampled clouds and their KDTrees are no more valid
+            cls.gt_kdtree_voxel = {}
+            cls.gt_kdtree = None       # rebuilt when needed, often from the worker thread of the ICP alignment
+
+    # ==============================================================================================
+    @classmethod
+    def get_gt_points_voxel(cls, voxel_size: float) -> np.ndarray:
+        """Get the ground truth point cloud downsampled on a voxel grid, only the first point of each voxel is kept.
+        The downsampled cloud is computed once for each voxel size and cached until the ground truth changes.
+
+        Arguments:
+            voxel_size {float} -- size of the voxel grid cells
+
+        Returns:
+            np.ndarray -- downsampled ground truth point cloud, shape (N, 3)
+        """
+        with cls._gt_lock:
+            points = cls.gt_points_voxel.get(voxel_size)
+            if points is None:
+                gt_points = cls.gt_points
+                voxels = np.floor(gt_points / voxel_size).astype(np.int64)
+                _, first_index = np.unique(voxels, axis=0, return_index=True)
+                points = gt_points[np.sort(first_index)]   # keep the original points order
+                cls.gt_points_voxel[voxel_size] = points
+                logger.debug("Ground truth downsampled from %i to %i points (voxel size=%f)",
+                             len(gt_points), len(points), voxel_size)
+            return points
+
+    # ==============================================================================================
+    @classmethod
+    def get_gt_kdtree(cls, voxel_size: float = 0.) -> KDTree:
+        """Get the KDTree of the ground truth point cloud, optionally of the voxel downsampled cloud.
+        Each KDTree is built on first request and cached until the ground truth changes.
+
+        Keyword Arguments:
+            voxel_size {float} -- size of the voxel grid cells, if <= 0 the whole cloud is used (default: {0.})
+
+        Returns:
+            KDTree -- ground truth KDTree
+        """
+        with cls._gt_lock:
+            if voxel_size <= 0.:
+                if cls.gt_kdtree is None and cls.gt_points is not None:
+                    cls.gt_kdtree = cls._build_kdtree(cls.gt_points)
+                return cls.gt_kdtree
+            kdtree = cls.gt_kdtree_voxel.get(voxel_size)
+            if kdtree is None:
+                kdtree = cls._build_kdtree(cls.get_gt_points_voxel(voxel_size))
+                cls.gt_kdtree_voxel[voxel_size] = kdtree
+            return kdtree
+
+    # ==============================================================================================
+    @staticmethod
+    def _build_kdtree(points: np.ndarray) -> KDTree:
+        """Build a balanced KDTree on a point cloud.
+
+        Arguments:
+            points {np.ndarray} -- point cloud, shape (N, 3)
+
+        Returns:
+            KDTree -- the KDTree, point indices are the same of `points`
+        """
+        kdtree = KDTree(len(points))
+        insert = kdtree.insert
+        for i, v in enumerate(points):
+            insert(v, i)
+        kdtree.balance()
+        return kdtree
 
     # ==============================================================================================
     @classmethod
@@ -141,4 +215,4 @@ class ReconstructionsManager:
         #
         if hasattr(bpy.types.Scene, "sfmflow_reconstructions_backup"):
             cls.reconstructions = bpy.types.Scene.sfmflow_reconstructions_backup[0]
-            cls.set_gt_points(bpy.types.Scene.sfmflow_reconstructions_backup[1])  # set gt points and rebuild kdtree
+            cls.set_gt_points(bpy.types.Scene.sfmflow_reconstructions_backup[1])  # set gt points, kdtree built on use
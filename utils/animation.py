@@ -1,13 +1,14 @@
 
 import logging
 from math import cos, degrees, pi, sin, sqrt
-from random import random, uniform
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
+
+import numpy as np
 
 import bpy
 from mathutils import Quaternion, Vector
 
-from .camera import camera_detect_nearest_intersection
+from .camera import camera_detect_nearest_intersection, detect_nearest_intersections
 from .math import euclidean_distance
 from .object import get_environment_collection
 
@@ -16,27 +17,36 @@ logger = logging.getLogger(__name__)
 
 RANDOMIZE_PERCENT = 0.05
 
+# random generator shared by the animation samplers, not affected by other users of the global numpy state
+RNG = np.random.RandomState()
+
+# object properties whose F-Curves are grouped by `keyframe_insert` in the "Object Transforms" action group
+OBJECT_TRANSFORM_PATHS = frozenset((
+    "location", "rotation_euler", "rotation_quaternion", "rotation_axis_angle", "scale",
+    "delta_location", "delta_rotation_euler", "delta_rotation_quaternion", "delta_scale"
+))
+
 
 # ==================================================================================================
-def build_camera_point(x: float, y: float, z: float, randomize: bool) -> Vector:
-    """Given the coordinates and optional randomization flag returns a point in form of {Vector}.
+def build_camera_points(x: np.ndarray, y: np.ndarray, z: np.ndarray, randomize: bool) -> np.ndarray:
+    """Given the coordinates and optional randomization flag returns the points as a single array.
 
     Arguments:
-        x {float} -- X coordinate
-        y {float} -- Y coordinate
-        z {float} -- Z coordinate
-        randomize {bool} -- if {True} the point is randomized +/- the percentage defined by `RANDOMIZE_PERCENT`
+        x {np.ndarray} -- X coordinates
+        y {np.ndarray} -- Y coordinates
+        z {np.ndarray} -- Z coordinates
+        randomize {bool} -- if {True} the points are randomized +/- the percentage defined by `RANDOMIZE_PERCENT`
 
     Returns:
-        Vector -- generated point
+        np.ndarray -- generated points, shape (N, 3)
     """
+    pts = np.empty((len(x), 3), dtype=np.float32)
+    pts[:, 0] = x
+    pts[:, 1] = y
+    pts[:, 2] = z
     if randomize:
-        p = Vector((x * uniform(1. - RANDOMIZE_PERCENT, 1. + RANDOMIZE_PERCENT),
-                    y * uniform(1. - RANDOMIZE_PERCENT, 1. + RANDOMIZE_PERCENT),
-                    z * uniform(1. - RANDOMIZE_PERCENT, 1. + RANDOMIZE_PERCENT)))
-    else:
-        p = Vector((x, y, z))
-    return p
+        pts *= RNG.uniform(1. - RANDOMIZE_PERCENT, 1. + RANDOMIZE_PERCENT, pts.shape)
+    return pts
 
 
 # ==================================================================================================
@@ -74,12 +84,114 @@ def is_keyframe(obj: bpy.types.Object, frame_number: int, keyframe_type: str = N
     Returns:
         bool -- true only if keyframe
     """
+    return frame_number in get_keyframes(obj, keyframe_type)
+
+
+# ==================================================================================================
+def get_keyframes(obj: bpy.types.Object, keyframe_type: str = None) -> np.ndarray:
+    """Get the frames with a keyframe set on an object, the keyframes are read at once from the first F-Curve.
+    Optionally restrict to keyframe type.
+
+    Arguments:
+        obj {bpy.types.Object} -- blender object
+
+    Keyword Arguments:
+        keyframe_type {str} -- type of keyframe (default: {None})
+
+    Returns:
+        np.ndarray -- frame numbers of the keyframes, empty if none
+    """
     anim = obj.animation_data
     if anim is not None and anim.action is not None:
         for fc in anim.action.fcurves:
             if not keyframe_type or fc.data_path == keyframe_type:
-                return frame_number in (round(p.co.x) for p in fc.keyframe_points)
-    return False
+                co = np.empty(len(fc.keyframe_points) * 2, dtype=np.float32)
+                fc.keyframe_points.foreach_get("co", co)
+                return np.round(co[::2]).astype(np.int64)
+    return np.empty(0, dtype=np.int64)
+
+
+# ==================================================================================================
+def insert_keyframes(obj: bpy.types.ID, data_path: str, frames: np.ndarray, values: np.ndarray,
+                     index: int = None, interpolation: str = None) -> None:
+    """Insert multiple keyframes on a property at once, same result of calling `keyframe_insert` on each frame.
+    The keyframe points are added and filled in a single batch for each F-Curve, keyframes are sorted once.
+
+    Arguments:
+        obj {bpy.types.ID} -- data-block to be animated
+        data_path {str} -- path to the animated property (e.g. `location`)
+        frames {np.ndarray} -- frame numbers, shape (N,)
+        values {np.ndarray} -- property values at each frame, shape (N,) or (N, C) for array properties
+
+    Keyword Arguments:
+        index {int} -- if set only this component of an array property is keyed, `values` has shape (N,)
+                       (default: {None})
+        interpolation {str} -- interpolation of the new keyframes, if {None} the user preference for new
+                               keyframes is used (default: {None})
+    """
+    count = len(frames)
+    if count == 0:
+        return
+    edit_prefs = bpy.context.preferences.edit
+    if interpolation is None:
+        interpolation = edit_prefs.keyframe_new_interpolation_type
+    handle_type = edit_prefs.keyframe_new_handle_type
+    frames = np.asarray(frames, dtype=np.float32)
+    values = np.asarray(values, dtype=np.float32).reshape(count, -1)
+    #
+    if obj.animation_data is None:
+        obj.animation_data_create()
+    action = obj.animation_data.action
+    if action is None:
+        action = bpy.data.actions.new(obj.name + "Action")
+        obj.animation_data.action = action
+    #
+    group = ""
+    if isinstance(obj, bpy.types.Object) and data_path in OBJECT_TRANSFORM_PATHS:
+        group = "Object Transforms"
+    #
+    indices = range(values.shape[1]) if index is None else (index,)
+    for column, array_index in enumerate(indices):
+        fcurve = action.fcurves.find(data_path, index=array_index)
+        if fcurve is None:
+            fcurve = action.fcurves.new(data_path, index=array_index, action_group=group)
+        keyframe_points = fcurve.keyframe_points
+        existing = len(keyframe_points)
+        if existing:
+            # keyframes already set on the new frames are replaced, as done by `keyframe_insert`
+            co = np.empty(existing * 2, dtype=np.float32)
+            keyframe_points.foreach_get("co", co)
+            replaced = np.flatnonzero(np.isin(co[::2], frames))
+            for i in replaced[::-1]:
+                keyframe_points.remove(keyframe_points[i], fast=True)
+            existing -= len(replaced)
+        #
+        # keep existing keyframes and append the new ones, coordinates are (frame, value) pairs
+        co = np.empty((existing + count) * 2, dtype=np.float32)
+        handle_left = np.empty_like(co)
+        handle_right = np.empty_like(co)
+        keyframe_points.foreach_get("co", co[:existing * 2])
+        keyframe_points.foreach_get("handle_left", handle_left[:existing * 2])
+        keyframe_points.foreach_get("handle_right", handle_right[:existing * 2])
+        co[existing * 2::2] = frames
+        co[existing * 2 + 1::2] = values[:, column]
+        # new handles are placed one frame before/after the keyframe, as done by `keyframe_insert`,
+        # auto handles are recomputed by the F-Curve update, FREE and ALIGNED ones are kept as they are
+        handle_left[existing * 2::2] = frames - 1.
+        handle_left[existing * 2 + 1::2] = values[:, column]
+        handle_right[existing * 2::2] = frames + 1.
+        handle_right[existing * 2 + 1::2] = values[:, column]
+        keyframe_points.add(count)
+        keyframe_points.foreach_set("co", co)
+        keyframe_points.foreach_set("handle_left", handle_left)
+        keyframe_points.foreach_set("handle_right", handle_right)
+        # added keyframes are BEZIER with AUTO_CLAMPED handles, touch them only for other settings
+        if interpolation != 'BEZIER' or handle_type != 'AUTO_CLAMPED':
+            for kp in keyframe_points[existing:]:
+                kp.interpolation = interpolation
+                kp.handle_left_type = handle_type
+                kp.handle_right_type = handle_type
+        fcurve.update()   # sort keyframes and recompute handles, once for all the new keyframes
 
 
 # ==================================================================================================
@@ -138,24 +250,60 @@ def set_camera_focus_to_intersection(view_layer: bpy.types.ViewLayer, camera: bp
         scene {bpy.types.Scene} -- scene
         frame_number {int} -- frame number in scene
     """
-    target = None
-    if not camera.data.dof.focus_object:
+    target = get_camera_focus_target(camera)
+    #
+    intersection_point = camera_detect_nearest_intersection(view_layer, camera, scene)
+    target.location = intersection_point
+    target.keyframe_insert(data_path="location", frame=frame_number)
+
+
+# ==================================================================================================
+def set_camera_focus_to_intersections(view_layer: bpy.types.ViewLayer, camera: bpy.types.Camera,
+                                      scene: bpy.types.Scene, frames: np.ndarray, positions: np.ndarray,
+                                      targets: np.ndarray) -> None:
+    """Given a sequence of camera poses sets the camera focus distance to the nearest object intersection point.
+    Same as calling `set_camera_focus_to_intersection` on each frame but without moving the camera,
+    the intersections are searched along the camera-target directions and the focus keyframes are set in batch.
+
+    Arguments:
+        view_layer {bpy.types.ViewLayer} -- desired view layer
+        camera {bpy.types.Camera} -- camera object
+        scene {bpy.types.Scene} -- scene
+        frames {np.ndarray} -- frame numbers, shape (N,)
+        positions {np.ndarray} -- camera location on each frame, shape (N, 3)
+        targets {np.ndarray} -- location looked at by the camera on each frame, shape (N, 3) or (3,)
+    """
+    target = get_camera_focus_target(camera)
+    #
+    positions = np.asarray(positions, dtype=np.float32)
+    directions = np.asarray(targets, dtype=np.float32) - positions
+    intersection_points = detect_nearest_intersections(view_layer, scene, positions, directions)
+    insert_keyframes(target, "location", frames, intersection_points)
+
+
+# ==================================================================================================
+def get_camera_focus_target(camera: bpy.types.Camera) -> bpy.types.Object:
+    """Get the depth of field focus object of a camera, an EMPTY is created and set as focus object if missing.
+
+    Arguments:
+        camera {bpy.types.Camera} -- camera object
+
+    Returns:
+        bpy.types.Object -- the focus object
+    """
+    target = camera.data.dof.focus_object
+    if not target:
         target = bpy.data.objects.new("EMPTY", None)
         target.name = camera.name + " Focus target"
         environment_collection = get_environment_collection()
         environment_collection.objects.link(target)
         camera.data.dof.focus_object = target
-    else:
-        target = camera.data.dof.focus_object
-    #
-    intersection_point = camera_detect_nearest_intersection(view_layer, camera, scene)
-    target.location = intersection_point
-    target.keyframe_insert(data_path="location", frame=frame_number)
+    return target
 
 
 # ==================================================================================================
 def sample_points_on_hemisphere(center: Vector = Vector((0, 0, 0)), radius: float = 1,
-                                samples: int = None, randomize: bool = False) -> List[Vector]:
+                                samples: int = None, randomize: bool = False) -> np.ndarray:
     """Sample points on an hemisphere.
 
     Keyword Arguments:
@@ -165,40 +313,36 @@ def sample_points_on_hemisphere(center: Vector = Vector((0, 0, 0)), radius: floa
         randomize {bool} -- if {True} the sample distances are randomized, otherwise are kept equal (default: {False})
 
     Returns:
-        List[Vector] -- list of vertices on the hemisphere
+        np.ndarray -- vertices on the hemisphere, shape (N, 3)
     """
 
     unit_point_count = 10   # default number of points radius=1 hemisphere
     if not samples:
         samples = int(radius * unit_point_count)
 
-    points = []
     offset = - 1.0 / samples
     increment = pi * (3.0 - sqrt(5.0))   # golden angle
 
-    for i in range(samples):
-        z = ((i * offset) + 1) + (offset / 2)
+    i = np.arange(samples)
+    z = ((i * offset) + 1) + (offset / 2)
 
-        r = sqrt(1 - z**2)
-        phi = i * increment
+    r = np.sqrt(1 - z**2)
+    phi = i * increment
 
-        x = cos(phi) * r
-        y = sin(phi) * r
+    x = np.cos(phi) * r
+    y = np.sin(phi) * r
 
-        p = build_camera_point(x * radius + center.x,
+    return build_camera_points(x * radius + center.x,
                                y * radius + center.y,
                                z * radius + center.z,
                                randomize)
-        points.append(p)
-
-    return points
 
 
 # ==================================================================================================
 def sample_points_on_conical_helix(start_center: Vector, start_point: Vector, turns: int, points_per_turn: int,
                                    height: float, height_type: str = "TOTAL", end_radius: float = None,
-                                   randomize: bool = False) -> List[Vector]:
-    """Create a list of vertices sampled on a conical helix.
+                                   randomize: bool = False) -> np.ndarray:
+    """Create an array of vertices sampled on a conical helix.
 
     Arguments:
         start_center {Vector} -- starting center point of the helix
@@ -217,7 +361,7 @@ def sample_points_on_conical_helix(start_center: Vector, start_point: Vector, tu
         ValueError: If `height_type` is invalid
 
     Returns:
-        List[Vector] -- list of vertices on the helix
+        np.ndarray -- vertices on the helix, shape (N, 3)
     """
     start_radius = euclidean_distance(start_center, start_point)
 
@@ -233,41 +377,23 @@ def sample_points_on_conical_helix(start_center: Vector, start_point: Vector, tu
     #
     radius_diff = end_radius - start_radius if end_radius else 0.
     num_of_points = turns * points_per_turn
-    z = start_point.z  # start Z coordinate
-    #
-    pts = []
-    c_point_num = 0   # current point number
-    y_offset = 0.
-    x_offset = 0.
     a_offset = Vector((0, 1, 0)).angle((start_point-start_center))
-    for _ in range(turns):
-        for i in range(points_per_turn):
-            a = 2 * pi * (i / points_per_turn) + a_offset   # point rotation angle
-
-            progress_percent = c_point_num / num_of_points
-            radius = start_radius + radius_diff * progress_percent
-
-            x = sin(a) * radius
-            y = cos(a) * radius
-
-            if c_point_num != 0:
-                z += (total_height / turns) / points_per_turn
-            else:
-                # for the first point get the offset
-                x_offset = start_point.x - x
-                y_offset = start_point.y - y
-            y += y_offset
-            x += x_offset
-
-            pts.append(build_camera_point(x, y, z, randomize))
-            c_point_num += 1
-    return pts
+    #
+    c_point_num = np.arange(num_of_points)   # points number
+    a = 2 * pi * ((c_point_num % points_per_turn) / points_per_turn) + a_offset   # points rotation angle
+    radius = start_radius + radius_diff * (c_point_num / num_of_points)
+    #
+    # the first point (angle=`a_offset`, radius=`start_radius`) must be equal to `start_point`
+    x = np.sin(a) * radius + (start_point.x - sin(a_offset) * start_radius)
+    y = np.cos(a) * radius + (start_point.y - cos(a_offset) * start_radius)
+    z = start_point.z + c_point_num * ((total_height / turns) / points_per_turn)
+    return build_camera_points(x, y, z, randomize)
 
 
 # ==================================================================================================
 def sample_points_on_helix(start_center: Vector, start_point: Vector, turns: int, points_per_turn: int,
-                           height: float, height_type: str = "TOTAL", randomize: bool = False) -> List[Vector]:
-    """Create a list of vertices sampled on a conical helix.
+                           height: float, height_type: str = "TOTAL", randomize: bool = False) -> np.ndarray:
+    """Create an array of vertices sampled on a helix.
 
     Arguments:
         start_point {Vector} -- first point of the helix
@@ -282,7 +408,7 @@ def sample_points_on_helix(start_center: Vector, start_point: Vector, turns: int
         randomize {bool} -- if {True} the position is randomized around the correct one (default: {False})
 
     Returns:
-        List[Vector] -- list of vertices on the helix
+        np.ndarray -- vertices on the helix, shape (N, 3)
     """
     return sample_points_on_conical_helix(start_center=start_center, start_point=start_point, turns=turns,
                                           points_per_turn=points_per_turn, height=height, height_type=height_type,
@@ -291,8 +417,8 @@ def sample_points_on_helix(start_center: Vector, start_point: Vector, turns: int
 
 # ==================================================================================================
 def sample_points_on_circle(center: Vector, start_point: Vector, points_count: int,
-                            randomize: bool = False) -> List[Vector]:
-    """Create a list of vertices sampled on a circle.
+                            randomize: bool = False) -> np.ndarray:
+    """Create an array of vertices sampled on a circle.
 
     Arguments:
         center {Vector} -- center point of the circle
@@ -303,39 +429,23 @@ def sample_points_on_circle(center: Vector, start_point: Vector, points_count: i
         randomize {bool} -- if {True} the position is randomized around the correct one (default: {False})
 
     Returns:
-        List[Vector] -- list of vertices on the circle
+        np.ndarray -- vertices on the circle, shape (N, 3)
     """
     radius = euclidean_distance(center, start_point)
+    a_offset = Vector((0, 1, 0)).angle((start_point-center))
     #
-    z = start_point.z  # start z coordinate
+    a = 2 * pi * (np.arange(points_count) / points_count) + a_offset   # points rotation angle
     #
-    pts = []
-    c_point_num = 0   # current point number (counter)
-    y_offset = 0.
-    x_offset = 0.
-    a_offset = Vector((0, 1, 0)).angle((start_point-center))
-    for i in range(points_count):
-        a = 2 * pi * (i / points_count) + a_offset   # point rotation angle
-
-        x = sin(a) * radius
-        y = cos(a) * radius
-
-        if c_point_num == 0:
-            # for the first point get the offset
-            x_offset = start_point.x - x
-            y_offset = start_point.y - y
-        y += y_offset
-        x += x_offset
-
-        pts.append(build_camera_point(x, y, z, randomize))
-        c_point_num += 1
-
-    return pts
+    # the first point (angle=`a_offset`) must be equal to `start_point`
+    x = np.sin(a) * radius + (start_point.x - sin(a_offset) * radius)
+    y = np.cos(a) * radius + (start_point.y - cos(a_offset) * radius)
+    z = np.full(points_count, start_point.z)
+    return build_camera_points(x, y, z, randomize)
 
 
 # ==================================================================================================
 def sun_animation_points(gravity_direction: Vector, north_direction: Vector, scene_bbox: Vector,
-                         radius: float, points_count: int) -> List[Vector]:
+                         radius: float, points_count: int) -> np.ndarray:
     """Sample sun lamp position points.
 
     Arguments:
@@ -349,7 +459,7 @@ def sun_animation_points(gravity_direction: Vector, north_direction: Vector, sce
         ValueError: if gravity and north directions aren't orthogonal
 
     Returns:
-        List[Vector] -- list of animation points
+        np.ndarray -- animation points, relative to the scene floor center, shape (N, 3)
     """
 
     # TODO add more realistic sun paths using geolocation and seasons ?
@@ -372,22 +482,10 @@ def sun_animation_points(gravity_direction: Vector, north_direction: Vector, sce
     b = h.copy()
     b.rotate(Quaternion(axis, pi/2))
 
-    pts = []
-    for i in range(points_count * 2):
-        theta = 2 * pi * (i / (points_count*2))
-
-        # circle
-        x = center.x + radius * cos(theta) * b.x + radius * sin(theta) * h.x
-        y = center.y + radius * cos(theta) * b.y + radius * sin(theta) * h.y
-        z = center.z + radius * cos(theta) * b.z + radius * sin(theta) * h.z
-        if z > scene_bbox.z_min:
-            continue
-
-        p = Vector((x, y, z)) - center
-        pts.append(p)
-        #bpy.ops.mesh.primitive_uv_sphere_add(radius=0.01, location=p)
-
-    return pts
+    # circle, sampled at once. the points are relative to the center, only the ones below the floor are kept
+    theta = np.arange(points_count * 2) * (2 * pi / (points_count * 2))
+    pts = np.outer(radius * np.cos(theta), b) + np.outer(radius * np.sin(theta), h)
+    return pts[center.z + pts[:, 2] <= scene_bbox.z_min]
 
 
 # ==================================================================================================
@@ -399,10 +497,8 @@ def animate_motion_blur(scene: bpy.types.Scene, blur_probability: float, shutter
         blur_probability {float} -- probability of a frame to have motion blur, in range [0-1]
         shutter {float} -- shutter value for motion blur generation
     """
-    for frame_number in range(scene.frame_start, scene.frame_end):
-        if random() < blur_probability:   # blur
-            scene.render.motion_blur_shutter = shutter  # shutter time
-            scene.render.keyframe_insert("motion_blur_shutter", frame=frame_number)
-        else:                             # no blur
-            scene.render.motion_blur_shutter = 0.
-            scene.render.keyframe_insert("motion_blur_shutter", frame=frame_number)
+    data_path = "render.motion_blur_shutter"
+    frames = np.arange(scene.frame_start, scene.frame_end)
+    # blur frames get the shutter time, the others no blur
+    values = np.where(RNG.random_sample(len(frames)) < blur_probability, shutter, 0.)
+    insert_keyframes(scene, data_path, frames, values)   # keys already set on these frames are replaced
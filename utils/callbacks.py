@@ -10,7 +10,7 @@ from bpy.app.handlers import persistent
 from mathutils import Vector
 from sfm_flow.reconstruction import ReconstructionsManager
 
-from . import GroundTruthWriter
+from . import GroundTruthWriter, SceneBoundingBox
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +73,42 @@ class Callbacks:
                 #
                 Callbacks._is_cam_pose_updating = False
 
+    ################################################################################################
+    # Scene bounding box cache
+    #
+
+    @staticmethod
+    @persistent
+    def scene_bbox_update(scene: bpy.types.Scene,   # pylint: disable=unused-argument
+                          depsgraph: bpy.types.Depsgraph = None) -> None:
+        """Clear the cached scene bounding boxes when objects are added, removed, moved or edited.
+        This callback is meant to be used on event `bpy.app.handlers.depsgraph_update_post`.
+
+        Arguments:
+            scene {bpy.types.Scene} -- blender's scene
+
+        Keyword Arguments:
+            depsgraph {bpy.types.Depsgraph} -- evaluated depsgraph, not provided by Blender 2.80 (default: {None})
+        """
+        if depsgraph is None:
+            SceneBoundingBox.clear_cache()
+            return
+        for update in depsgraph.updates:
+            if update.is_updated_geometry or update.is_updated_transform or \
+                    isinstance(update.id, bpy.types.Collection):
+                SceneBoundingBox.clear_cache()
+                return
+
+    @staticmethod
+    @persistent
+    def scene_bbox_clear(*args) -> None:  # pylint: disable=unused-argument
+        """Clear the cached scene bounding boxes, the cached scene data is no more valid.
+        This callback is meant to be used on events `bpy.app.handlers.undo_post`, `bpy.app.handlers.redo_post`
+        and `bpy.app.handlers.frame_change_post` (animated objects move on frame change).
+        Newer Blender versions also pass the depsgraph to some handlers, arguments are ignored.
+        """
+        SceneBoundingBox.clear_cache()
+
     ################################################################################################
     # Post .blend save update
     #
@@ -106,6 +142,7 @@ class Callbacks:
         2. Export ground truth csv file if required.
         """
         ReconstructionsManager.remove_all()
+        SceneBoundingBox.clear_cache()
         #
         #
         logger.debug("sys.argv: %s", sys.argv)
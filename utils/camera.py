@@ -1,6 +1,8 @@
 
 import logging
 
+import numpy as np
+
 import bpy
 from mathutils import Vector
 
@@ -64,14 +66,43 @@ def camera_detect_nearest_intersection(view_layer: bpy.types.ViewLayer, camera:
         # see https://wiki.blender.org/wiki/Reference/Release_Notes/2.91/Python_API
         view_layer = view_layer.depsgraph
     result, location, *_ = scene.ray_cast(view_layer, camera.location, camera_lookat)
-    logger.debug("Nearest intersection for camera %s (location=%s, look_at=%s): found=%s, position=%s",
-                 camera.name, camera.location, camera_lookat, result, location)
+    if logger.isEnabledFor(logging.DEBUG):   # called once per animation frame, skip argument packing if not needed
+        logger.debug("Nearest intersection for camera %s (location=%s, look_at=%s): found=%s, position=%s",
+                     camera.name, camera.location, camera_lookat, result, location)
     if result:
         return location
     else:
         return camera.location
 
 
+# ==================================================================================================
+def detect_nearest_intersections(view_layer: bpy.types.ViewLayer, scene: bpy.types.Scene,
+                                 origins: np.ndarray, directions: np.ndarray) -> np.ndarray:
+    """Detect the nearest intersection point along multiple rays.
+
+    Arguments:
+        view_layer {bpy.types.ViewLayer} -- view layer
+        scene {bpy.types.Scene} -- render scene
+        origins {np.ndarray} -- rays origin, shape (N, 3)
+        directions {np.ndarray} -- rays direction, shape (N, 3)
+
+    Returns:
+        np.ndarray -- points of intersection between the rays and the scene objects, shape (N, 3).
+                      When no intersection is found the ray origin is returned.
+    """
+    if bpy.app.version >= BlenderVersion.V2_91:
+        # see https://wiki.blender.org/wiki/Reference/Release_Notes/2.91/Python_API
+        view_layer = view_layer.depsgraph
+    ray_cast = scene.ray_cast
+    #
+    locations = np.array(origins, dtype=np.float32)
+    for i, (origin, direction) in enumerate(zip(origins, directions)):
+        result, location, *_ = ray_cast(view_layer, origin, direction)
+        if result:
+            locations[i] = location
+    return locations
+
+
 # ==================================================================================================
 def camera_detect_dof_distance(view_layer: bpy.types.ViewLayer, camera: bpy.types.Camera,
                                scene: bpy.types.Scene) -> float:
@@ -122,8 +122,7 @@ class GroundTruthWriter():
         cam_dists_objs = []
         cam_heights = []
         for i in range(self.scene.frame_start, self.scene.frame_end+1):
-            self.scene.frame_set(i)
-            bpy.context.view_layer.update()  # make the frame change effective
+            self.scene.frame_set(i)   # also evaluates the depsgraph for the new frame
             cam_pos = self.camera.matrix_world.to_translation() * u_scale  # cam position
             cam_dists_bbc.append(euclidean_distance(bbox_center, cam_pos))
             cam_dists_objs.append(camera_detect_dof_distance(bpy.context.view_layer, self.camera, self.scene))
@@ -193,8 +192,7 @@ class GroundTruthWriter():
     def save_entry_for_all_frames(self) -> None:
         """Write the CSV entries for all the frames in scene animation."""
         for i in range(self.scene.frame_start, self.scene.frame_end+1):
-            self.scene.frame_set(i)
-            bpy.context.view_layer.update()  # make the frame change effective
+            self.scene.frame_set(i)   # also evaluates the depsgraph for the new frame
             self.save_entry_for_current_frame()
 
     ################################################################################################
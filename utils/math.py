@@ -37,3 +37,34 @@ def mean_angle(deg: List[float]) -> float:
         float -- mean of angles
     """
     return degrees(phase(sum(rect(1, radians(d)) for d in deg)/len(deg)))
+
+
+# ==================================================================================================
+def rotation_differences(v: Vector, targets: np.ndarray) -> np.ndarray:
+    """Rotations from a vector to each of the target vectors, same result of `Vector.rotation_difference()`
+    computed on all the targets at once.
+
+    Arguments:
+        v {Vector} -- starting vector
+        targets {np.ndarray} -- target vectors, shape (N, 3)
+
+    Returns:
+        np.ndarray -- rotation quaternions (w, x, y, z), shape (N, 4)
+    """
+    a = np.asarray(v, dtype=np.float64)
+    targets = np.asarray(targets, dtype=np.float64).reshape(-1, 3)
+    #
+    # half-way quaternion: w = |a||t| + a.t, xyz = a x t
+    lengths = np.sqrt((a @ a) * np.einsum('ij,ij->i', targets, targets))
+    q = np.empty((len(targets), 4))
+    q[:, 0] = lengths + targets @ a
+    q[:, 1:] = np.cross(a, targets)
+    norms = np.linalg.norm(q, axis=1)
+    #
+    # opposite or null vectors do not define a unique rotation, use the same fallback of mathutils
+    degenerate = norms <= 1e-6 * lengths
+    for i in np.flatnonzero(degenerate):
+        q[i] = Vector(v).rotation_difference(Vector(targets[i]))
+        norms[i] = 1.
+    q /= norms[:, np.newaxis]
+    return q
@@ -7,7 +7,8 @@ from mathutils import Vector
 
 from .blender_version import BlenderVersion
 
-ASSET_FOLDER = path.join(path.dirname(path.abspath(__file__)), "../assets")
+# normalized so that the same asset always maps to the same path, see `images.load(check_existing=True)`
+ASSET_FOLDER = path.normpath(path.join(path.dirname(path.abspath(__file__)), "../assets"))
 
 
 # ==================================================================================================
@@ -24,6 +25,11 @@ def get_asset(name: str) -> str:
     return path.join(ASSET_FOLDER, name)
 
 
+# floor textures paths, resolved once: (color, roughness, normal, displacement)
+_CONCRETE12_TEXTURES = tuple(get_asset("Concrete12_{}.jpg".format(m)) for m in ("col", "rgh", "nrm", "disp"))
+_CONCRETE05_TEXTURES = tuple(get_asset("Concrete05_{}.jpg".format(m)) for m in ("col", "rgh", "nrm", "disp"))
+
+
 # ==================================================================================================
 def add_texture_mapping_node(node_tree: bpy.types.NodeTree, location: Vector = Vector((0, 0, 0)),
                              rotation: Vector = Vector((0, 0, 0)),
@@ -80,8 +86,9 @@ def add_img_texture_node(node_tree: bpy.types.NodeTree, tex_image: str,
     """
     tex_image_node = node_tree.nodes.new(type="ShaderNodeTexImage")
     tex_image_node.location = nodes_location
-    img = bpy.data.images.load(tex_image)
-    img.pack()
+    img = bpy.data.images.load(tex_image, check_existing=True)   # reuse the image if already loaded
+    if not img.packed_file:
+        img.pack()
     tex_image_node.image = img
     if label:
         tex_image_node.label = label
@@ -262,18 +269,12 @@ def add_floor_material_nodes(node_tree: bpy.types.NodeTree, floor_size: float) -
         (floor_size / 2., floor_size / 2., floor_size / 2.)), nodes_location=Vector((0, 0)))
     bsdf_node_1, disp_node_1 = add_principled_bsdf_material_nodes(node_tree,
                                                                   tex_mapping_node,
-                                                                  get_asset("Concrete12_col.jpg"),
-                                                                  get_asset("Concrete12_rgh.jpg"),
-                                                                  get_asset("Concrete12_nrm.jpg"),
-                                                                  get_asset("Concrete12_disp.jpg"),
+                                                                  *_CONCRETE12_TEXTURES,
                                                                   nodes_location=Vector((500, 1100)))
 
     bsdf_node_2, disp_node_2 = add_principled_bsdf_material_nodes(node_tree,
                                                                   tex_mapping_node,
-                                                                  get_asset("Concrete05_col.jpg"),
-                                                                  get_asset("Concrete05_rgh.jpg"),
-                                                                  get_asset("Concrete05_nrm.jpg"),
-                                                                  get_asset("Concrete05_disp.jpg"),
+                                                                  *_CONCRETE05_TEXTURES,
                                                                   nodes_location=Vector((500, -350)))
 
     # --- mix maps
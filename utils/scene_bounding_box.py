@@ -1,6 +1,6 @@
 
 import logging
-from typing import Tuple
+from typing import Dict, Tuple
 
 import bpy
 from mathutils import Vector
@@ -13,6 +13,9 @@ logger = logging.getLogger(__name__)
 class SceneBoundingBox():
     """Scene bounding box, build a bounding box that includes all objects except the excluded ones."""
 
+    # bounding boxes cached by `get_cached()`, cleared on scene changes by `Callbacks.scene_bbox_update()`
+    _cache = {}   # type: Dict[Tuple[int, str, Tuple[str]], SceneBoundingBox]
+
     ################################################################################################
     # Properties
     #
@@ -61,6 +64,41 @@ class SceneBoundingBox():
         #
         self.compute()
 
+    ################################################################################################
+    # Cache
+    #
+
+    # ==============================================================================================
+    @classmethod
+    def get_cached(cls, scene: bpy.types.Scene,
+                   exclude_collections: Tuple[str] = ("SfM_Environment", "SfM_Reconstructions")) -> 'SceneBoundingBox':
+        """Get the scene bounding box, it is computed only if the scene changed since the last request.
+        The returned bounding box is shared, do not modify it.
+
+        Arguments:
+            scene {bpy.types.Scene} -- scene
+
+        Keyword Arguments:
+            exclude_collections {Tuple[str]} -- collections to exclude
+                                                (default: {("SfM_Environment", "SfM_Reconstructions")})
+
+        Returns:
+            SceneBoundingBox -- the scene bounding box
+        """
+        # the scene pointer identifies the scene also when renamed, the name guards against a reused pointer
+        key = (scene.as_pointer(), scene.name, exclude_collections)
+        bbox = cls._cache.get(key)
+        if bbox is None:
+            bbox = cls(scene, exclude_collections)
+            cls._cache[key] = bbox
+        return bbox
+
+    # ==============================================================================================
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all the cached bounding boxes."""
+        cls._cache.clear()
+
     ################################################################################################
     # Methods
     #